@@ -21,6 +21,42 @@ class AdaptableHeapPriorityQueue(HeapPriorityQueue):
     self._data[i]._index = i             # reset locator index (post-swap)
     self._data[j]._index = j             # reset locator index (post-swap)
 
+  # override the sift operations to record the index of every moved locator
+  def _upheap(self, j):
+    data = self._data
+    item = data[j]
+    key = item._key
+    while j > 0:
+      parent = (j-1) // 2
+      above = data[parent]
+      if not key < above._key:
+        break
+      data[j] = above                    # move parent down into the hole
+      above._index = j
+      j = parent
+    data[j] = item
+    item._index = j
+
+  def _downheap(self, j):
+    data = self._data
+    n = len(data)
+    item = data[j]
+    key = item._key
+    child = 2*j + 1                      # left child
+    while child < n:
+      right = child + 1
+      if right < n and data[right]._key < data[child]._key:
+        child = right                    # right child is smaller
+      below = data[child]
+      if not below._key < key:
+        break
+      data[j] = below                    # move small child up into the hole
+      below._index = j
+      j = child
+      child = 2*j + 1
+    data[j] = item
+    item._index = j
+
   def _bubble(self, j):
     if j > 0 and self._data[j] < self._data[self._parent(j)]:
       self._upheap(j)
@@ -28,6 +64,20 @@ class AdaptableHeapPriorityQueue(HeapPriorityQueue):
       self._downheap(j)
 
   #------------------------------ public behaviors ------------------------------
+  @classmethod
+  def from_iterable(cls, pairs, locators=None):
+    """Return a new priority queue holding an iteration of (k,v) pairs, in O(n) time.
+
+    If a list locators is given, the Locator of each pair is appended to it,
+    in the order of pairs.
+    """
+    pq = cls()
+    pq._data = [cls.Locator(k, v, j) for j, (k, v) in enumerate(pairs)]
+    if locators is not None:
+      locators.extend(pq._data)          # before heapify reorders the list
+    pq._heapify()
+    return pq
+
   def add(self, key, value):
     """Add a key-value pair."""
     token = self.Locator(key, value, len(self._data)) # initiaize locator index
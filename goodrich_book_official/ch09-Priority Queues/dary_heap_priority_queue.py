@@ -0,0 +1,163 @@
+# Description: 
+
+from .heap_priority_queue import HeapPriorityQueue
+from .adaptable_heap_priority_queue import AdaptableHeapPriorityQueue
+
+# d-ary heaps: the children of index j are d*j+1 through d*j+d, and the parent
+# of index j is (j-1)//d.  A larger arity makes the heap shallower, so add and
+# key decreases (which sift up, one comparison per level) get cheaper, while
+# remove_min (which sifts down, d comparisons per level) gets dearer.
+
+def _validate_arity(d):
+  """Verify that d is a usable heap arity."""
+  if not isinstance(d, int) or d < 2:
+    raise ValueError('arity must be an integer of at least 2')
+
+class _DaryIndexing:
+  """Index arithmetic of a heap of arity self._d, replacing the binary one.
+
+  _left and _right give the first and last of the d children of index j.
+  """
+
+  def _parent(self, j):
+    return (j-1) // self._d
+
+  def _left(self, j):
+    return self._d*j + 1
+
+  def _right(self, j):
+    return self._d*j + self._d
+
+  def _has_left(self, j):
+    return self._left(j) < len(self._data)     # index beyond end of list?
+
+  def _has_right(self, j):
+    return self._right(j) < len(self._data)    # index beyond end of list?
+
+class DaryHeapPriorityQueue(_DaryIndexing, HeapPriorityQueue):
+  """A min-oriented priority queue implemented with a d-ary heap."""
+
+  #------------------------------ nonpublic behaviors ------------------------------
+  def _upheap(self, j):
+    data = self._data
+    d = self._d
+    item = data[j]
+    key = item._key
+    while j > 0:
+      parent = (j-1) // d
+      above = data[parent]
+      if not key < above._key:
+        break
+      data[j] = above                  # move parent down into the hole
+      j = parent
+    data[j] = item
+
+  def _downheap(self, j):
+    data = self._data
+    n = len(data)
+    d = self._d
+    item = data[j]
+    key = item._key
+    first = d*j + 1                    # first child
+    while first < n:
+      child = first
+      small = data[first]._key
+      for c in range(first + 1, min(first + d, n)):
+        if data[c]._key < small:       # find the smallest of the children
+          child = c
+          small = data[c]._key
+      if not small < key:
+        break
+      data[j] = data[child]            # move small child up into the hole
+      j = child
+      first = d*j + 1
+    data[j] = item
+
+  #------------------------------ public behaviors ------------------------------
+  def __init__(self, d=4):
+    """Create a new empty Priority Queue with a heap of arity d."""
+    _validate_arity(d)
+    super().__init__()
+    self._d = d
+
+  @classmethod
+  def from_iterable(cls, pairs, *, d=4):
+    """Return a new d-ary priority queue holding an iteration of (k,v) pairs, in O(n) time."""
+    pq = cls(d)
+    pq._data = [cls._Item(k, v) for k, v in pairs]
+    pq._heapify()
+    return pq
+
+  def arity(self):
+    """Return the number of children of each heap node."""
+    return self._d
+
+class AdaptableDaryHeapPriorityQueue(_DaryIndexing, AdaptableHeapPriorityQueue):
+  """A locator-based priority queue implemented with a d-ary heap."""
+
+  #------------------------------ nonpublic behaviors ------------------------------
+  # as for DaryHeapPriorityQueue, also recording the index of every moved locator
+  def _upheap(self, j):
+    data = self._data
+    d = self._d
+    item = data[j]
+    key = item._key
+    while j > 0:
+      parent = (j-1) // d
+      above = data[parent]
+      if not key < above._key:
+        break
+      data[j] = above                  # move parent down into the hole
+      above._index = j
+      j = parent
+    data[j] = item
+    item._index = j
+
+  def _downheap(self, j):
+    data = self._data
+    n = len(data)
+    d = self._d
+    item = data[j]
+    key = item._key
+    first = d*j + 1                    # first child
+    while first < n:
+      child = first
+      small = data[first]._key
+      for c in range(first + 1, min(first + d, n)):
+        if data[c]._key < small:       # find the smallest of the children
+          child = c
+          small = data[c]._key
+      if not small < key:
+        break
+      below = data[child]
+      data[j] = below                  # move small child up into the hole
+      below._index = j
+      j = child
+      first = d*j + 1
+    data[j] = item
+    item._index = j
+
+  #------------------------------ public behaviors ------------------------------
+  def __init__(self, d=4):
+    """Create a new empty Priority Queue with a heap of arity d."""
+    _validate_arity(d)
+    super().__init__()
+    self._d = d
+
+  @classmethod
+  def from_iterable(cls, pairs, locators=None, *, d=4):
+    """Return a new d-ary priority queue holding an iteration of (k,v) pairs, in O(n) time.
+
+    If a list locators is given, the Locator of each pair is appended to it,
+    in the order of pairs.
+    """
+    pq = cls(d)
+    pq._data = [cls.Locator(k, v, j) for j, (k, v) in enumerate(pairs)]
+    if locators is not None:
+      locators.extend(pq._data)        # before heapify reorders the list
+    pq._heapify()
+    return pq
+
+  def arity(self):
+    """Return the number of children of each heap node."""
+    return self._d
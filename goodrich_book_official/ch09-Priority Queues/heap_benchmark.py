@@ -0,0 +1,173 @@
+# Description: 
+
+import sys
+import tracemalloc
+from heapq import heapify, heappop, heappush
+from random import Random
+from time import perf_counter
+
+from .heap_priority_queue import HeapPriorityQueue
+from .dary_heap_priority_queue import AdaptableDaryHeapPriorityQueue
+from .pairing_heap_priority_queue import PairingHeapPriorityQueue
+from .indexed_heap_priority_queue import IndexedMinHeap
+
+# Compares the loop-based heap of HeapPriorityQueue with the recursive,
+# swap-based sift operations it replaced, and bulk from_iterable construction
+# with one-at-a-time add.  The standard heapq module gives a lower bound.
+# Finally, adaptable d-ary heaps of several arities and a pairing heap run an
+# insert-heavy and a pop-heavy mix of add, update (decrease-key) and
+# remove_min calls.  Last, the memory of an adaptable heap holding n integer
+# ids is compared with that of an array-backed IndexedMinHeap.
+#
+#   python -m <package>.heap_benchmark [operations]     (e.g. 10000000)
+
+class RecursiveHeapPriorityQueue(HeapPriorityQueue):
+  """HeapPriorityQueue with the original recursive, swap-based sift operations."""
+
+  def _upheap(self, j):
+    parent = self._parent(j)
+    if j > 0 and self._data[j] < self._data[parent]:
+      self._swap(j, parent)
+      self._upheap(parent)             # recur at position of parent
+
+  def _downheap(self, j):
+    if self._has_left(j):
+      left = self._left(j)
+      small_child = left               # although right may be smaller
+      if self._has_right(j):
+        right = self._right(j)
+        if self._data[right] < self._data[left]:
+          small_child = right
+      if self._data[small_child] < self._data[j]:
+        self._swap(j, small_child)
+        self._downheap(small_child)    # recur at position of small child
+
+  def remove_min(self):
+    self._swap(0, len(self._data) - 1)
+    item = self._data.pop()
+    self._downheap(0)
+    return (item._key, item._value)
+
+def add_then_remove(cls, keys):
+  """Add every key to a new cls instance, then remove them all; return seconds."""
+  start = perf_counter()
+  pq = cls()
+  for k in keys:
+    pq.add(k, None)
+  while not pq.is_empty():
+    pq.remove_min()
+  return perf_counter() - start
+
+def heapq_add_then_remove(keys):
+  """Do the same operations with the heapq module; return seconds."""
+  start = perf_counter()
+  heap = []
+  for k in keys:
+    heappush(heap, k)
+  while heap:
+    heappop(heap)
+  return perf_counter() - start
+
+def time_build(f):
+  """Return the seconds taken by f()."""
+  start = perf_counter()
+  f()
+  return perf_counter() - start
+
+MIXES = (                              # (name, add, update, remove_min shares, preload)
+  ('insert-heavy', 0.6, 0.3, 0.1, 0),
+  ('pop-heavy', 0.1, 0.0, 0.9, 1.0),
+  )
+
+def mixed_workload(pq, operations, add, update, preload=0, seed=0):
+  """Run a random mix of operations on an adaptable pq; return seconds.
+
+  Each operation is an add with probability add, a decrease-key update of a
+  random entry with probability update, and otherwise a remove_min.  The
+  queue first receives preload*operations entries (not timed).
+  """
+  rand = Random(seed)
+  plan = []                            # (choice, key, pick) of each operation
+  for _ in range(operations):
+    plan.append((rand.random(), rand.random(), rand.random()))
+  locators = []                        # locator of each entry (None once removed)
+  keys = []
+  for _ in range(int(preload * operations)):
+    k = rand.random()
+    keys.append(k)
+    locators.append(pq.add(k, len(locators)))
+  start = perf_counter()
+  for choice, k, pick in plan:
+    if choice < add:
+      keys.append(k)
+      locators.append(pq.add(k, len(locators)))
+    elif choice < add + update:
+      j = int(pick * len(locators)) if locators else 0
+      if locators and locators[j] is not None:
+        keys[j] *= k                   # a smaller key
+        pq.update(locators[j], keys[j], j)
+    elif not pq.is_empty():
+      _, j = pq.remove_min()
+      locators[j] = None
+  return perf_counter() - start
+
+def peak_memory(f):
+  """Return the peak bytes allocated while running f()."""
+  tracemalloc.start()
+  try:
+    f()
+    return tracemalloc.get_traced_memory()[1]
+  finally:
+    tracemalloc.stop()
+
+if __name__ == '__main__':
+  try:
+    operations = int(sys.argv[1])
+  except (IndexError, ValueError):
+    operations = 1000000
+  n = operations // 2                  # each key is added once and removed once
+  rand = Random(n)
+  keys = [rand.random() for _ in range(n)]
+  old = add_then_remove(RecursiveHeapPriorityQueue, keys)
+  new = add_then_remove(HeapPriorityQueue, keys)
+  base = heapq_add_then_remove(keys)
+  print('{0} operations'.format(2 * n))
+  print('  recursive swaps {0:8.3f}s'.format(old))
+  print('  moving hole     {0:8.3f}s   speedup {1:.2f}x'.format(new, old / new))
+  print('  heapq           {0:8.3f}s'.format(base))
+
+  def repeated_add():
+    pq = HeapPriorityQueue()
+    for k in keys:
+      pq.add(k, None)
+  pairs = [(k, None) for k in keys]
+  added = time_build(repeated_add)
+  bulk = time_build(lambda: HeapPriorityQueue.from_iterable(pairs))
+  print('build of {0} items'.format(n))
+  print('  repeated add    {0:8.3f}s'.format(added))
+  print('  from_iterable   {0:8.3f}s   speedup {1:.2f}x'.format(bulk, added / bulk))
+  print('  heapify         {0:8.3f}s'.format(time_build(lambda: heapify(list(keys)))))
+
+  for name, add, update, _, preload in MIXES:
+    times = {'d={0}'.format(d): mixed_workload(AdaptableDaryHeapPriorityQueue(d), n,
+                                               add, update, preload)
+             for d in (2, 4, 8)}
+    times['pairing'] = mixed_workload(PairingHeapPriorityQueue(), n, add, update, preload)
+    best = min(times, key=times.get)
+    print('{0} mix of {1} operations: '.format(name, n) +
+          '   '.join('{0} {1:.3f}s'.format(label, t) for label, t in times.items()) +
+          '   best {0}'.format(best))
+
+  def adaptable_ids():
+    pq = AdaptableDaryHeapPriorityQueue(2)
+    for i, k in enumerate(keys):
+      pq.add(k, i)
+  def indexed_ids():
+    pq = IndexedMinHeap(n)
+    for i, k in enumerate(keys):
+      pq.push(i, k)
+  locator = peak_memory(adaptable_ids)
+  indexed = peak_memory(indexed_ids)
+  print('memory for {0} ids'.format(n))
+  print('  locators        {0:8.1f} bytes/id'.format(locator / n))
+  print('  indexed arrays  {0:8.1f} bytes/id'.format(indexed / n))
@@ -26,29 +26,63 @@ class HeapPriorityQueue(PriorityQueueBase): # base class defines _Item
     """Swap the elements at indices i and j of array."""
     self._data[i], self._data[j] = self._data[j], self._data[i]
 
+  # The sift operations move a "hole" rather than swapping: the item at j is
+  # set aside, larger parents (or smaller children) are moved into the hole
+  # one level at a time, and the item is stored once where the hole stops.
+  # Index arithmetic and key comparisons are inlined in the loops.
   def _upheap(self, j):
-    parent = self._parent(j)
-    if j > 0 and self._data[j] < self._data[parent]:
-      self._swap(j, parent)
-      self._upheap(parent)             # recur at position of parent
-  
+    data = self._data
+    item = data[j]
+    key = item._key
+    while j > 0:
+      parent = (j-1) // 2
+      above = data[parent]
+      if not key < above._key:
+        break
+      data[j] = above                  # move parent down into the hole
+      j = parent
+    data[j] = item
+
   def _downheap(self, j):
-    if self._has_left(j):
-      left = self._left(j)
-      small_child = left               # although right may be smaller
-      if self._has_right(j):
-        right = self._right(j)
-        if self._data[right] < self._data[left]:
-          small_child = right
-      if self._data[small_child] < self._data[j]:
-        self._swap(j, small_child)
-        self._downheap(small_child)    # recur at position of small child
+    data = self._data
+    n = len(data)
+    item = data[j]
+    key = item._key
+    child = 2*j + 1                    # left child
+    while child < n:
+      right = child + 1
+      if right < n and data[right]._key < data[child]._key:
+        child = right                  # right child is smaller
+      below = data[child]
+      if not below._key < key:
+        break
+      data[j] = below                  # move small child up into the hole
+      j = child
+      child = 2*j + 1
+    data[j] = item
+
+  def _heapify(self):
+    """Establish heap order over all of self._data, bottom-up in O(n) time."""
+    for j in range(self._parent(len(self._data) - 1), -1, -1):
+      self._downheap(j)                # leaves are already heaps
 
   #------------------------------ public behaviors ------------------------------
   def __init__(self):
     """Create a new empty Priority Queue."""
     self._data = []
 
+  @classmethod
+  def from_iterable(cls, pairs):
+    """Return a new priority queue holding an iteration of (k,v) pairs.
+
+    This takes O(n) time by bottom-up heap construction, rather than the
+    O(n log n) time of n successive calls to add.
+    """
+    pq = cls()
+    pq._data = [cls._Item(k, v) for k, v in pairs]
+    pq._heapify()
+    return pq
+
   def __len__(self):
     """Return the number of items in the priority queue."""
     return len(self._data)
@@ -75,7 +109,10 @@ class HeapPriorityQueue(PriorityQueueBase): # base class defines _Item
     """
     if self.is_empty():
       raise Empty('Priority queue is empty.')
-    self._swap(0, len(self._data) - 1)           # put minimum item at the end
-    item = self._data.pop()                      # and remove it from the list;
-    self._downheap(0)                            # then fix new root
+    data = self._data
+    item = data[0]
+    last = data.pop()                            # remove the last item;
+    if data:
+      data[0] = last                             # move it to the root
+      self._downheap(0)                          # then fix new root
     return (item._key, item._value)
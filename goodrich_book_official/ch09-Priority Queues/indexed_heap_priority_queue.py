@@ -0,0 +1,135 @@
+# Description: 
+
+from array import array
+from ..exceptions import Empty
+
+class IndexedMinHeap:
+  """A min-oriented binary heap of the integer ids 0, 1, ..., n-1, by key.
+
+  Instead of one Locator object per entry, the heap keeps three arrays of
+  machine words: the ids in heap order, the heap position of each id (-1 if
+  absent), and the key of each id.  An id is located in O(1) time by its
+  position, so decrease_key needs no token.  Keys are floats by default
+  (typecode 'd'); typecode 'q' stores 64-bit integer keys.
+  """
+
+  #------------------------------ nonpublic behaviors ------------------------------
+  def _validate(self, i):
+    """Verify that i is an id of this heap."""
+    if not 0 <= i < len(self._pos):
+      raise ValueError('id out of range')
+
+  def _upheap(self, j):
+    heap, pos, keys = self._heap, self._pos, self._keys
+    i = heap[j]
+    key = keys[i]
+    while j > 0:
+      parent = (j-1) // 2
+      above = heap[parent]
+      if not key < keys[above]:
+        break
+      heap[j] = above                  # move parent down into the hole
+      pos[above] = j
+      j = parent
+    heap[j] = i
+    pos[i] = j
+
+  def _downheap(self, j):
+    heap, pos, keys = self._heap, self._pos, self._keys
+    n = self._size
+    i = heap[j]
+    key = keys[i]
+    child = 2*j + 1                    # left child
+    while child < n:
+      right = child + 1
+      if right < n and keys[heap[right]] < keys[heap[child]]:
+        child = right                  # right child is smaller
+      below = heap[child]
+      if not keys[below] < key:
+        break
+      heap[j] = below                  # move small child up into the hole
+      pos[below] = j
+      j = child
+      child = 2*j + 1
+    heap[j] = i
+    pos[i] = j
+
+  #------------------------------ public behaviors ------------------------------
+  def __init__(self, n, typecode='d'):
+    """Create an empty heap for the ids 0 through n-1."""
+    if typecode not in ('d', 'q'):
+      raise ValueError("typecode must be 'd' or 'q'")
+    self._heap = array('q', bytes(8 * n))        # ids in heap order
+    self._pos = array('q', [-1]) * n             # heap position of each id
+    self._keys = array(typecode, bytes(8 * n))   # key of each id
+    self._size = 0
+
+  def __len__(self):
+    """Return the number of ids in the heap."""
+    return self._size
+
+  def is_empty(self):
+    """Return True if the heap is empty."""
+    return self._size == 0
+
+  def contains(self, i):
+    """Return True if id i is in the heap."""
+    self._validate(i)
+    return self._pos[i] >= 0
+
+  def key(self, i):
+    """Return the key of id i, which must be in the heap."""
+    if not self.contains(i):
+      raise ValueError('id not in heap')
+    return self._keys[i]
+
+  def push(self, i, key):
+    """Add id i with the given key.
+
+    Raise a ValueError if i is already in the heap.
+    """
+    if self.contains(i):
+      raise ValueError('id already in heap')
+    self._keys[i] = key
+    j = self._size
+    self._heap[j] = i
+    self._size += 1
+    self._upheap(j)
+
+  def decrease_key(self, i, key):
+    """Lower the key of id i, which must be in the heap, to key.
+
+    Raise a ValueError if i is absent or key is larger than its current key.
+    """
+    if not self.contains(i):
+      raise ValueError('id not in heap')
+    if self._keys[i] < key:
+      raise ValueError('key would increase')
+    self._keys[i] = key
+    self._upheap(self._pos[i])
+
+  def min(self):
+    """Return but do not remove (id,key) tuple with minimum key.
+
+    Raise Empty exception if empty.
+    """
+    if self._size == 0:
+      raise Empty('Priority queue is empty.')
+    i = self._heap[0]
+    return (i, self._keys[i])
+
+  def pop_min(self):
+    """Remove and return (id,key) tuple with minimum key.
+
+    Raise Empty exception if empty.
+    """
+    if self._size == 0:
+      raise Empty('Priority queue is empty.')
+    heap = self._heap
+    i = heap[0]
+    self._size -= 1
+    self._pos[i] = -1
+    if self._size > 0:
+      heap[0] = heap[self._size]       # move the last id to the root
+      self._downheap(0)                # then fix new root
+    return (i, self._keys[i])
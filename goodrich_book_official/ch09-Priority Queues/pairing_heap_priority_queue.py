@@ -0,0 +1,190 @@
+# Description: 
+
+from .priority_queue_base import PriorityQueueBase
+from ..exceptions import Empty
+
+class PairingHeapPriorityQueue(PriorityQueueBase):
+  """A locator-based priority queue implemented with a pairing heap.
+
+  The heap is a tree, ordered by key, of Locators with any number of
+  children each.  add, update to a smaller key and meld link two trees
+  in O(1) time; remove_min and remove merge the children of a removed
+  node in two passes, taking O(log n) amortized time.
+  """
+
+  #------------------------------ nested Locator class ------------------------------
+  class Locator(PriorityQueueBase._Item):
+    """Token for locating an entry of the priority queue."""
+    __slots__ = '_child', '_sibling', '_prev', '_owner'
+
+    def __init__(self, k, v, owner):
+      super().__init__(k, v)
+      self._child = None               # leftmost child
+      self._sibling = None             # next sibling to the right
+      self._prev = None                # left sibling, or parent if leftmost
+      self._owner = owner              # membership token of containing queue
+
+  class _Token:
+    """Membership token; a melded queue's token forwards to the new owner's."""
+    __slots__ = '_forward'
+
+    def __init__(self):
+      self._forward = None
+
+  #------------------------------ nonpublic behaviors ------------------------------
+  def _validate(self, loc):
+    """Verify that loc is a Locator of an entry of this queue."""
+    if not isinstance(loc, self.Locator):
+      raise TypeError('Locator expected')
+    token = loc._owner
+    if token is None:
+      raise ValueError('Invalid locator')
+    while token._forward is not None:          # follow tokens of melded queues
+      if token._forward._forward is not None:
+        token._forward = token._forward._forward   # shorten the chain
+      token = token._forward
+    loc._owner = token
+    if token is not self._token:
+      raise ValueError('Invalid locator')
+
+  def _link(self, a, b):
+    """Link the trees with roots a and b, returning the root of the result."""
+    if b._key < a._key:
+      a, b = b, a
+    b._prev = a                        # b becomes the leftmost child of a
+    b._sibling = a._child
+    if a._child is not None:
+      a._child._prev = b
+    a._child = b
+    return a
+
+  def _cut(self, x):
+    """Detach the subtree rooted at non-root node x from its tree."""
+    if x._prev._child is x:
+      x._prev._child = x._sibling      # x was the leftmost child
+    else:
+      x._prev._sibling = x._sibling
+    if x._sibling is not None:
+      x._sibling._prev = x._prev
+    x._prev = x._sibling = None
+
+  def _merge_pairs(self, first):
+    """Merge a list of sibling trees, starting at first, into one tree.
+
+    Siblings are linked in pairs from left to right, and then the pairs are
+    linked from right to left.  Return the new root (or None).
+    """
+    pairs = []
+    while first is not None:
+      a = first
+      b = a._sibling
+      a._prev = a._sibling = None
+      if b is None:
+        pairs.append(a)
+        break
+      first = b._sibling
+      b._prev = b._sibling = None
+      pairs.append(self._link(a, b))
+    root = pairs.pop() if pairs else None
+    while pairs:
+      root = self._link(pairs.pop(), root)
+    return root
+
+  def _detach(self, loc):
+    """Remove loc from the heap, keeping the rest of its subtree."""
+    if loc is self._root:
+      self._root = self._merge_pairs(loc._child)
+    else:
+      self._cut(loc)
+      rest = self._merge_pairs(loc._child)
+      if rest is not None:
+        self._root = self._link(self._root, rest)
+    loc._child = None
+
+  #------------------------------ public behaviors ------------------------------
+  def __init__(self):
+    """Create a new empty Priority Queue."""
+    self._root = None
+    self._size = 0
+    self._token = self._Token()
+
+  def __len__(self):
+    """Return the number of items in the priority queue."""
+    return self._size
+
+  def add(self, key, value):
+    """Add a key-value pair and return its Locator."""
+    token = self.Locator(key, value, self._token)
+    self._root = token if self._root is None else self._link(self._root, token)
+    self._size += 1
+    return token
+
+  def min(self):
+    """Return but do not remove (k,v) tuple with minimum key.
+
+    Raise Empty exception if empty.
+    """
+    if self.is_empty():
+      raise Empty('Priority queue is empty.')
+    return (self._root._key, self._root._value)
+
+  def remove_min(self):
+    """Remove and return (k,v) tuple with minimum key.
+
+    Raise Empty exception if empty.
+    """
+    if self.is_empty():
+      raise Empty('Priority queue is empty.')
+    item = self._root
+    self._detach(item)
+    item._owner = None                 # invalidate its locator
+    self._size -= 1
+    return (item._key, item._value)
+
+  def update(self, loc, newkey, newval):
+    """Update the key and value for the entry identified by Locator loc.
+
+    A smaller (or equal) key takes O(1) time; a larger key is handled as a
+    removal and reinsertion of the same Locator.
+    """
+    self._validate(loc)
+    if newkey < loc._key or not loc._key < newkey:
+      loc._key = newkey
+      loc._value = newval
+      if loc is not self._root:
+        self._cut(loc)                 # heap order holds within its subtree
+        self._root = self._link(self._root, loc)
+    else:
+      self._detach(loc)
+      loc._key = newkey
+      loc._value = newval
+      self._root = loc if self._root is None else self._link(self._root, loc)
+
+  def remove(self, loc):
+    """Remove and return the (k,v) pair identified by Locator loc."""
+    self._validate(loc)
+    self._detach(loc)
+    loc._owner = None                  # invalidate the locator
+    self._size -= 1
+    return (loc._key, loc._value)
+
+  def meld(self, other):
+    """Move all entries of PairingHeapPriorityQueue other into this queue.
+
+    This takes O(1) time, and the Locators of other remain valid for this
+    queue.  other is left empty.
+    """
+    if not isinstance(other, PairingHeapPriorityQueue):
+      raise TypeError('PairingHeapPriorityQueue expected')
+    if other is self:
+      raise ValueError('cannot meld a queue with itself')
+    if other._root is not None:
+      if self._root is None:
+        self._root = other._root
+      else:
+        self._root = self._link(self._root, other._root)
+    self._size += other._size
+    other._token._forward = self._token  # other's locators now belong here
+    other._root = None
+    other._size = 0
+    other._token = self._Token()
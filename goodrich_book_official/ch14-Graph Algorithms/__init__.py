@@ -1 +1 @@
-__all__ = ['bfs', 'dfs', 'graph', 'graph_examples', 'mst', 'partition', 'shortest_paths', 'topological_sort', 'transitive_closure']
+__all__ = ['all_pairs_shortest_paths', 'bfs', 'csr_algorithms', 'csr_graph', 'delta_stepping', 'dfs', 'direction_optimizing_bfs', 'dynamic_topological_sort', 'edgelist_loader', 'graph', 'graph_benchmark', 'graph_examples', 'graph_generators', 'graph_views', 'mst', 'mst_engines', 'parallel_components', 'partition', 'shortest_path_cache', 'shortest_paths', 'shortest_paths_benchmark', 'strong_components', 'topological_sort', 'transitive_closure']
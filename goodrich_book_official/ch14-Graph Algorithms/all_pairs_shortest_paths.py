@@ -0,0 +1,204 @@
+# Description: 
+
+from array import array
+from multiprocessing import Pool
+
+from .csr_graph import CSRGraph
+from .csr_algorithms import shortest_path_lengths
+
+try:
+  import numpy
+except ImportError:             # NumPy is optional; plain arrays are used instead
+  numpy = None
+
+INF = float('inf')
+
+class AllPairsShortestPaths:
+  """Distance and next-hop matrices for all pairs of vertices of a graph.
+
+  Row i of the distance matrix holds the distances from the i-th vertex, and
+  row i of the next-hop matrix the index of the vertex that follows it on a
+  shortest path to each destination (-1 if unreachable).  Rows are NumPy
+  arrays when the matrices were computed with NumPy, and arrays otherwise.
+  """
+
+  def __init__(self, verts, dist, nxt):
+    """Do not call constructor directly. Use all_pairs_shortest_paths(g)."""
+    self._verts = verts
+    self._index = {v: i for i, v in enumerate(verts)}
+    self._dist = dist
+    self._next = nxt
+
+  def vertices(self):
+    """Return the list of vertices, in matrix order."""
+    return self._verts
+
+  def distance(self, u, v):
+    """Return the shortest-path distance from u to v (infinite if unreachable)."""
+    return float(self._dist[self._index[u]][self._index[v]])
+
+  def path(self, u, v):
+    """Return the list of vertices on a shortest path from u to v.
+
+    Return an empty list if v is not reachable from u.
+    """
+    i = self._index[u]
+    j = self._index[v]
+    if self._next[i][j] < 0:
+      return []
+    path = [u]
+    while i != j:
+      i = int(self._next[i][j])
+      path.append(self._verts[i])
+    return path
+
+  def distance_matrix(self):
+    """Return the distance matrix (a NumPy array or a list of arrays)."""
+    return self._dist
+
+  def next_hop_matrix(self):
+    """Return the next-hop matrix (a NumPy array or a list of arrays)."""
+    return self._next
+
+def all_pairs_shortest_paths(g, method=None, processes=None):
+  """Compute shortest paths between all pairs of vertices of weighted graph g.
+
+  method is 'floyd_warshall' (suited to dense graphs, and vectorised with
+  NumPy when available) or 'dijkstra' (one search per source, run across a
+  process pool of the given size; suited to sparse graphs).  By default the
+  method is chosen by the density of g.  Edge weights must be numeric, and
+  nonnegative for 'dijkstra'.
+
+  Return an AllPairsShortestPaths instance.
+  """
+  n = g.vertex_count()
+  if method is None:
+    method = 'floyd_warshall' if 8 * g.edge_count() >= n * n else 'dijkstra'
+  if method == 'floyd_warshall':
+    return _floyd_warshall(g)
+  if method == 'dijkstra':
+    return _repeated_dijkstra(g, processes)
+  raise ValueError('unknown method: ' + repr(method))
+
+#------------------------- Floyd-Warshall engine -------------------------
+def _floyd_warshall(g):
+  """Return AllPairsShortestPaths computed by the Floyd-Warshall algorithm."""
+  verts = list(g.vertices())
+  index = {v: i for i, v in enumerate(verts)}
+  n = len(verts)
+  links = []                                    # (i, j, weight) of every edge
+  for v in verts:
+    for e in g.incident_edges(v):
+      links.append((index[v], index[e.opposite(v)], _weight(e)))
+  if numpy is not None:
+    dist, nxt = _floyd_warshall_numpy(n, links)
+  else:
+    dist, nxt = _floyd_warshall_rows(n, links)
+  return AllPairsShortestPaths(verts, dist, nxt)
+
+def _floyd_warshall_numpy(n, links):
+  """Return (dist, next) NumPy matrices, relaxing through k by broadcasting."""
+  dist = numpy.full((n, n), INF)
+  nxt = numpy.full((n, n), -1, dtype=numpy.int64)
+  for i, j, w in links:
+    dist[i, j] = w
+    nxt[i, j] = j
+  diagonal = numpy.arange(n)
+  dist[diagonal, diagonal] = 0
+  nxt[diagonal, diagonal] = diagonal
+  for k in range(n):
+    via = dist[:, k, None] + dist[None, k, :]   # min-plus step for all i,j
+    better = via < dist
+    dist = numpy.where(better, via, dist)
+    nxt = numpy.where(better, nxt[:, k, None], nxt)
+  return dist, nxt
+
+def _floyd_warshall_rows(n, links):
+  """Return (dist, next) lists of array rows, without NumPy."""
+  dist = [array('d', [INF]) * n for _ in range(n)]
+  nxt = [array('q', [-1]) * n for _ in range(n)]
+  for i, j, w in links:
+    dist[i][j] = w
+    nxt[i][j] = j
+  for i in range(n):
+    dist[i][i] = 0
+    nxt[i][i] = i
+  for k in range(n):
+    row_k = dist[k]
+    for i in range(n):
+      row_i = dist[i]
+      dik = row_i[k]
+      if dik == INF:
+        continue                                # no path i to k yet
+      next_i = nxt[i]
+      hop = next_i[k]
+      for j in range(n):
+        alt = dik + row_k[j]
+        if alt < row_i[j]:
+          row_i[j] = alt
+          next_i[j] = hop
+  return dist, nxt
+
+#------------------------- repeated Dijkstra engine -------------------------
+_worker_csr = None                              # graph of each pool worker
+
+def _init_worker(csr):
+  """Install the graph shared by all searches of a pool worker."""
+  global _worker_csr
+  _worker_csr = csr
+
+def _dijkstra_rows(sources):
+  """Return (source, dist row, next-hop row) for each source in a worker."""
+  csr = _worker_csr
+  n = csr.vertex_count()
+  results = []
+  for s in sources:
+    d, tree = shortest_path_lengths(csr, s, True)
+    dist = array('d', [INF]) * n
+    nxt = array('q', [-1]) * n
+    nxt[s] = s
+    for v, dv in d.items():                     # settled in order of distance
+      dist[v] = dv
+      if v != s:
+        u = csr.opposite(tree[v], v)            # parent of v in the tree
+        nxt[v] = v if u == s else nxt[u]
+    results.append((s, dist, nxt))
+  return results
+
+def _repeated_dijkstra(g, processes):
+  """Return AllPairsShortestPaths computed by one Dijkstra search per source."""
+  full = CSRGraph.from_graph(g)
+  if not full.is_weighted():
+    raise ValueError('graph must have numeric edge weights')
+  n = full.vertex_count()
+  origin, destination, weight = full.edge_arrays()
+  csr = CSRGraph.from_arrays(n, origin, destination, weight, full.is_directed())
+  step = max(1, n // (8 * (processes or 4)))    # a few batches per worker
+  batches = [range(i, min(i + step, n)) for i in range(0, n, step)]
+  dist = [None] * n
+  nxt = [None] * n
+  if processes == 1:
+    _init_worker(csr)
+    chunks = map(_dijkstra_rows, batches)
+  else:
+    pool = Pool(processes, _init_worker, (csr,))
+    chunks = pool.imap_unordered(_dijkstra_rows, batches)
+  try:
+    for chunk in chunks:
+      for s, row, hops in chunk:
+        dist[s] = row
+        nxt[s] = hops
+  finally:
+    if processes != 1:
+      pool.close()
+      pool.join()
+    else:
+      _init_worker(None)                        # release the graph held here
+  return AllPairsShortestPaths([full.vertex(i) for i in range(n)], dist, nxt)
+
+def _weight(e):
+  """Return the numeric weight of edge e."""
+  w = e.element()
+  if type(w) not in (int, float):
+    raise ValueError('graph must have numeric edge weights')
+  return w
@@ -0,0 +1,205 @@
+# Description: 
+
+from heapq import heappush, heappop
+
+from .partition import ArrayPartition
+
+try:
+  import numpy
+except ImportError:             # NumPy is optional; sorted() is used instead
+  numpy = None
+
+# Traversal, shortest-path and MST algorithms for a CSRGraph.  Each function
+# mirrors the one of the same name for Graph, with vertices and edges given by
+# integer ids; use CSRGraph.to_vertex_map to translate results back.
+
+def BFS(csr, s, discovered):
+  """Perform BFS of the undiscovered portion of CSRGraph csr starting at id s.
+
+  discovered is a dictionary mapping each vertex id to the id of the edge that
+  was used to discover it (s should be mapped to None prior to the call).
+  """
+  offsets, target, eid, _ = csr.rows()
+  level = [s]                                   # first level includes only s
+  while len(level) > 0:
+    next_level = []                             # gather newly found vertices
+    for u in level:
+      for slot in range(offsets[u], offsets[u+1]):
+        v = target[slot]
+        if v not in discovered:                 # v is an unvisited vertex
+          discovered[v] = eid[slot]             # slot's edge discovered v
+          next_level.append(v)
+    level = next_level
+
+def BFS_complete(csr):
+  """Perform BFS for entire CSR graph and return forest as a dictionary.
+
+  Result maps each vertex id to the id of the edge used to discover it
+  (vertices that are roots of a BFS tree are mapped to None).
+  """
+  forest = {}
+  for u in csr.vertices():
+    if u not in forest:
+      forest[u] = None                          # u will be a root of a tree
+      BFS(csr, u, forest)
+  return forest
+
+def DFS(csr, u, discovered):
+  """Perform DFS of the undiscovered portion of CSRGraph csr starting at id u.
+
+  discovered is a dictionary mapping each vertex id to the id of the edge that
+  was used to discover it (u should be "discovered" prior to the call).
+  An explicit stack is used, but vertices are discovered in the same order as
+  by the recursive dfs.DFS.
+  """
+  offsets, target, eid, _ = csr.rows()
+  path = [u]                                    # vertices of the current path
+  cursor = [offsets[u]]                         # next slot to scan for each
+  while path:
+    v = path[-1]
+    slot = cursor[-1]
+    end = offsets[v+1]
+    while slot < end and target[slot] in discovered:
+      slot += 1                                 # skip visited neighbors
+    if slot == end:                             # v is finished
+      path.pop()
+      cursor.pop()
+    else:
+      w = target[slot]
+      discovered[w] = eid[slot]                 # slot's edge discovered w
+      cursor[-1] = slot + 1                     # resume after it later
+      path.append(w)                            # "recursively" explore from w
+      cursor.append(offsets[w])
+
+def DFS_complete(csr):
+  """Perform DFS for entire CSR graph and return forest as a dictionary.
+
+  Result maps each vertex id to the id of the edge used to discover it
+  (vertices that are roots of a DFS tree are mapped to None).
+  """
+  forest = {}
+  for u in csr.vertices():
+    if u not in forest:
+      forest[u] = None                          # u will be the root of a tree
+      DFS(csr, u, forest)
+  return forest
+
+def shortest_path_lengths(csr, src, with_tree=False, reachable_only=False):
+  """Compute shortest-path distances from id src to all vertex ids.
+
+  The CSR graph must be weighted.  Return dictionary mapping each vertex id
+  to its distance from src, which is infinite for an unreachable vertex, as
+  for shortest_paths.shortest_path_lengths; if reachable_only is True,
+  unreachable ids are left out instead.  If with_tree is True, return a
+  (distances, tree) pair of reachable ids only, where tree maps each
+  reachable id other than src to the id of its parent edge, as recorded
+  during relaxation.
+  """
+  offsets, target, eid, weight = csr.rows()
+  if weight is None:
+    raise ValueError('graph must have numeric edge weights')
+  inf = float('inf')
+  d = [inf] * csr.vertex_count()                # d[v] is upper bound from src
+  d[src] = 0
+  cloud = {}                                    # map reachable v to its d[v]
+  parent = {}                                   # map v to edge id that set d[v]
+  heap = [(0, src)]                             # may hold stale entries
+  while heap:
+    key, u = heappop(heap)
+    if u in cloud:
+      continue                                  # stale entry; u already settled
+    cloud[u] = key
+    for slot in range(offsets[u], offsets[u+1]):
+      v = target[slot]
+      if v not in cloud:
+        alt = key + weight[slot]                # relaxation step on edge (u,v)
+        if alt < d[v]:
+          d[v] = alt
+          parent[v] = eid[slot]
+          heappush(heap, (alt, v))
+  if with_tree:
+    return cloud, parent                        # every reached v is settled
+  if not reachable_only:
+    for v in range(len(d)):
+      if v not in cloud:
+        cloud[v] = inf                          # as reported for a Graph
+  return cloud
+
+def shortest_path_tree(csr, s, d):
+  """Reconstruct shortest-path tree rooted at id s, given distance map d.
+
+  Return tree as a map from each reachable vertex id v (other than s) to the
+  id of the edge used to reach v from its parent in the tree.
+  """
+  offsets, target, eid, weight = csr.rows(False)  # consider INCOMING edges
+  tree = {}
+  for v in d:
+    if v != s:
+      for slot in range(offsets[v], offsets[v+1]):
+        u = target[slot]
+        if u in d and d[v] == d[u] + weight[slot]:
+          tree[v] = eid[slot]
+  return tree
+
+def MST_PrimJarnik(csr):
+  """Compute a minimum spanning forest of a weighted CSR graph.
+
+  Return a list of the edge ids that comprise the forest (in arbitrary order).
+  """
+  offsets, target, eid, weight = csr.rows()
+  if weight is None:
+    raise ValueError('graph must have numeric edge weights')
+  n = csr.vertex_count()
+  intree = bytearray(n)                         # intree[v] is 1 once v is added
+  tree = []
+  for root in range(n):                         # grow a tree from each new root
+    if intree[root]:
+      continue
+    heap = [(0, root, -1)]                      # (weight, vertex, edge id)
+    while heap:
+      wgt, u, e = heappop(heap)
+      if intree[u]:
+        continue                                # stale entry
+      intree[u] = 1
+      if e >= 0:
+        tree.append(e)
+      for slot in range(offsets[u], offsets[u+1]):
+        v = target[slot]
+        if not intree[v]:
+          heappush(heap, (weight[slot], v, eid[slot]))
+  return tree
+
+def MST_Kruskal(csr):
+  """Compute a minimum spanning forest of a weighted CSR graph by Kruskal.
+
+  Edges are ordered by a single (stable, vectorised with NumPy when
+  available) sort of the weight array rather than pushed through a heap.
+  Return a list of the edge ids that comprise the forest.
+  """
+  origin, destination, weight = csr.edge_arrays()
+  if weight is None:
+    raise ValueError('graph must have numeric edge weights')
+  n = csr.vertex_count()
+  if numpy is not None:
+    order = numpy.argsort(numpy.asarray(weight), kind='stable').tolist()
+  else:
+    order = sorted(range(len(weight)), key=weight.__getitem__)
+  forest = ArrayPartition(n)                    # union-find over vertex ids
+  tree = []
+  for e in order:
+    if len(tree) == n - 1:
+      break                                     # forest already spanning
+    if forest.union(origin[e], destination[e]):
+      tree.append(e)
+  return tree
+
+def connected_components(csr):
+  """Return an array mapping each vertex id to the id of its component.
+
+  Each component is identified by one of its vertex ids.  For a directed
+  graph, edge directions are ignored (weakly connected components).
+  """
+  origin, destination, _ = csr.edge_arrays()
+  forest = ArrayPartition(csr.vertex_count())
+  forest.union_many(origin, destination)
+  return forest.find_many()
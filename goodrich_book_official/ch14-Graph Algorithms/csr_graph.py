@@ -0,0 +1,373 @@
+# Description: 
+
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+
+# Binary snapshot layout (see save and load).  A fixed little-endian header
+#
+#   magic, n, m, directed, weight typecode, length of pickled labels
+#
+# is followed by the int64 origin and destination arrays, the weight array
+# (int64 or float64, if weighted), the outgoing rows (offsets, target, edge id,
+# slot weight), the incoming rows of a directed graph, and finally the pickled
+# vertex labels (if any).  Every array starts at a multiple of 8 bytes.
+
+SNAPSHOT_MAGIC = b'DSAPCSR1'
+SNAPSHOT_HEADER = struct.Struct('<8sqqqqq')
+
+class CSRGraph:
+  """Frozen compressed sparse row (CSR) representation of a graph.
+
+  Vertices are identified by the integers 0, 1, ..., n-1 and edges by the
+  integers 0, 1, ..., m-1.  The outgoing edges of vertex v occupy the slots
+  offsets[v] through offsets[v+1]-1 of the parallel target, edge id and weight
+  arrays.  An undirected edge occupies one slot in the row of each endpoint,
+  except that a self-loop occupies a single slot, as it does in Graph.
+  """
+
+  #------------------------- construction -------------------------
+  def __init__(self, n, directed, origin, destination, weight, out_rows,
+               in_rows=None, labels=None, edges=None):
+    """Do not call constructor directly. Use from_graph(g) or from_edgelist(E)."""
+    self._n = n
+    self._directed = directed
+    self._origin = origin                       # edge id -> origin id
+    self._destination = destination             # edge id -> destination id
+    self._weight = weight                       # edge id -> weight (or None)
+    self._out = out_rows                        # (offsets, target, eid, weight)
+    # only keep a second row set for directed graph; use alias for undirected
+    self._in = in_rows if directed else out_rows
+    self._labels = labels                       # vertex id -> external vertex
+    self._index = None                          # external vertex -> id (lazy)
+    self._edges = edges                         # edge id -> external edge
+    self._snapshot = None                       # path of mapped snapshot file
+
+  @classmethod
+  def from_graph(cls, g):
+    """Return a CSR copy of Graph g.
+
+    Vertex ids follow the order of g.vertices(), and each row lists its edges
+    in the order reported by g.incident_edges, so traversals visit vertices in
+    the same order as they do on g.
+    """
+    labels = list(g.vertices())
+    index = {v: i for i, v in enumerate(labels)}
+    directed = g.is_directed()
+    edges = []
+    edge_id = {}                                # map from Edge to its id
+    origin = array('q')
+    destination = array('q')
+    for v in labels:
+      for e in g.incident_edges(v):
+        if e not in edge_id:
+          edge_id[e] = len(edges)
+          edges.append(e)
+          # a directed edge leaves the vertex whose outgoing row lists it (which
+          # also holds for a reversed view); keep undirected edges as stored
+          u, w = (v, e.opposite(v)) if directed else e.endpoints()
+          origin.append(index[u])
+          destination.append(index[w])
+    weight = _weight_array([e.element() for e in edges])
+
+    def rows(outgoing):
+      offsets = array('q', [0])
+      target = array('q')
+      eid = array('q')
+      for v in labels:
+        for e in g.incident_edges(v, outgoing):
+          target.append(index[e.opposite(v)])
+          eid.append(edge_id[e])
+        offsets.append(len(target))
+      return offsets, target, eid, _slot_weights(weight, eid)
+
+    csr = cls(len(labels), directed, origin, destination, weight, rows(True),
+              rows(False) if directed else None, labels, edges)
+    csr._index = index
+    return csr
+
+  @classmethod
+  def from_edgelist(cls, E, directed=False):
+    """Return a CSR graph based on a sequence of edge tuples.
+
+    Edges can be either of form (origin,destination) or
+    (origin,destination,element), as for graph_examples.graph_from_edgelist.
+    Vertex ids are assigned to labels in order of first appearance.
+    """
+    index = {}
+    origin = array('q')
+    destination = array('q')
+    elements = []
+    for e in E:
+      origin.append(index.setdefault(e[0], len(index)))
+      destination.append(index.setdefault(e[1], len(index)))
+      elements.append(e[2] if len(e) > 2 else None)
+    csr = cls.from_arrays(len(index), origin, destination,
+                          _weight_array(elements), directed, list(index))
+    csr._index = index
+    return csr
+
+  @classmethod
+  def from_arrays(cls, n, origin, destination, weight=None, directed=False,
+                  labels=None):
+    """Return a CSR graph with n vertices from parallel per-edge arrays.
+
+    origin[k] and destination[k] are the integer endpoints of edge k, and
+    weight[k] (if given) its numeric element.  labels optionally maps each
+    vertex id to an external vertex label.
+    """
+    origin = array('q', origin)
+    destination = array('q', destination)
+    if weight is not None and not isinstance(weight, array):
+      weight = _weight_array(weight)
+    out_rows = _build_rows(n, origin, destination, weight, directed)
+    in_rows = _build_rows(n, destination, origin, weight, True) if directed else None
+    return cls(n, directed, origin, destination, weight, out_rows, in_rows, labels)
+
+  @classmethod
+  def load(cls, path, labels=True):
+    """Return a read-only CSR graph mapped from a snapshot written by save.
+
+    The arrays are memoryviews of the file mapped with mmap rather than
+    copies, so loading takes time independent of the number of edges and
+    processes that load the same snapshot share its pages.  Such a graph
+    pickles as its path, so a worker process maps the file for itself.
+    Vertex labels are unpickled only if labels is True.
+    """
+    with open(path, 'rb') as fp:
+      mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, n, m, directed, code, size = SNAPSHOT_HEADER.unpack_from(mm)
+    if magic != SNAPSHOT_MAGIC:
+      raise ValueError('not a CSR graph snapshot')
+    view = memoryview(mm)
+    pos = SNAPSHOT_HEADER.size
+
+    def take(count, typecode='q'):
+      nonlocal pos
+      part = view[pos:pos + 8 * count]
+      pos += 8 * count
+      if sys.byteorder == 'little':
+        return part.cast(typecode)
+      part = array(typecode, part)              # big-endian host: swap a copy
+      part.byteswap()
+      return part
+
+    weighted = code != 0
+    typecode = chr(code) if weighted else 'q'
+
+    def rows():
+      offsets = take(n + 1)
+      slots = offsets[n]                        # a self-loop fills one slot
+      return (offsets, take(slots), take(slots),
+              take(slots, typecode) if weighted else None)
+
+    origin = take(m)
+    destination = take(m)
+    weight = take(m, typecode) if weighted else None
+    out_rows = rows()
+    in_rows = rows() if directed else None
+    names = None
+    if labels and size:
+      names = pickle.loads(view[pos:pos + size])
+    csr = cls(n, bool(directed), origin, destination, weight, out_rows, in_rows, names)
+    csr._snapshot = path
+    return csr
+
+  def save(self, path):
+    """Write a binary snapshot of the graph to path, for reloading by load.
+
+    Edge weights are stored as numbers; vertex labels (for a graph built from
+    an edge list) are pickled, but the Vertex and Edge instances of a graph
+    built by from_graph are not kept, and load identifies them by their
+    element and by id, respectively.
+    """
+    if self._edges is not None and self._labels is not None:
+      labels = [v.element() for v in self._labels]
+    else:
+      labels = self._labels
+    data = pickle.dumps(labels) if labels is not None else b''
+    code = 0 if self._weight is None else ord(_typecode(self._weight))
+    m = len(self._origin)
+    with open(path, 'wb') as fp:
+      fp.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, self._n, m, int(self._directed),
+                                    code, len(data)))
+      parts = [self._origin, self._destination, self._weight]
+      parts.extend(self._out)
+      if self._directed:
+        parts.extend(self._in)
+      for part in parts:
+        if part is not None:
+          part = array(_typecode(part), part)
+          if sys.byteorder != 'little':
+            part.byteswap()
+          part.tofile(fp)
+      fp.write(data)
+
+  def __getstate__(self):
+    """Pickle a snapshot-backed graph as its path (see load)."""
+    if self._snapshot is not None:
+      return {'_snapshot': self._snapshot, '_labels': self._labels is not None}
+    return self.__dict__
+
+  def __setstate__(self, state):
+    if '_index' not in state:                   # remap the snapshot file
+      state = CSRGraph.load(state['_snapshot'], state['_labels']).__dict__
+    self.__dict__.update(state)
+
+  #------------------------- public CSRGraph methods -------------------------
+  def is_directed(self):
+    """Return True if this is a directed graph; False if undirected."""
+    return self._directed
+
+  def is_weighted(self):
+    """Return True if every edge has a numeric weight."""
+    return self._weight is not None
+
+  def vertex_count(self):
+    """Return the number of vertices in the graph."""
+    return self._n
+
+  def vertices(self):
+    """Return an iteration of all vertex ids of the graph."""
+    return range(self._n)
+
+  def edge_count(self):
+    """Return the number of edges in the graph."""
+    return len(self._origin)
+
+  def edges(self):
+    """Return an iteration of all edge ids of the graph."""
+    return range(len(self._origin))
+
+  def endpoints(self, e):
+    """Return (u,v) tuple of vertex ids for edge e."""
+    return (self._origin[e], self._destination[e])
+
+  def opposite(self, e, v):
+    """Return the vertex id that is opposite v on edge e."""
+    u = self._origin[e]
+    return self._destination[e] if v == u else u
+
+  def weight(self, e):
+    """Return the numeric weight of edge e (or None if unweighted)."""
+    return None if self._weight is None else self._weight[e]
+
+  def degree(self, v, outgoing=True):
+    """Return number of (outgoing) edges incident to vertex v in the graph.
+
+    If graph is directed, optional parameter used to count incoming edges.
+    """
+    offsets = (self._out if outgoing else self._in)[0]
+    return offsets[v+1] - offsets[v]
+
+  def neighbors(self, v, outgoing=True):
+    """Return an array of the vertex ids adjacent to v along (outgoing) edges."""
+    offsets, target, _, _ = self._out if outgoing else self._in
+    return target[offsets[v]:offsets[v+1]]
+
+  def incident_edges(self, v, outgoing=True):
+    """Return an array of the ids of all (outgoing) edges incident to v."""
+    offsets, _, eid, _ = self._out if outgoing else self._in
+    return eid[offsets[v]:offsets[v+1]]
+
+  def rows(self, outgoing=True):
+    """Return the raw (offsets, target, edge id, weight) row arrays.
+
+    The weight array is None for an unweighted graph.  These arrays are
+    shared with the graph and must not be modified.
+    """
+    return self._out if outgoing else self._in
+
+  def edge_arrays(self):
+    """Return the raw (origin, destination, weight) per-edge arrays."""
+    return self._origin, self._destination, self._weight
+
+  #------------------------- translation to external objects -------------------------
+  def vertex(self, i):
+    """Return the external vertex (Graph Vertex or label) with id i."""
+    return i if self._labels is None else self._labels[i]
+
+  def edge(self, e):
+    """Return the Graph Edge with id e, or a (u,v,weight) tuple of ids."""
+    if self._edges is not None:
+      return self._edges[e]
+    return (self._origin[e], self._destination[e], self.weight(e))
+
+  def index(self, v):
+    """Return the id of external vertex v (Graph Vertex or label)."""
+    if self._labels is None:
+      return v
+    if self._index is None:
+      self._index = {x: i for i, x in enumerate(self._labels)}
+    return self._index[v]
+
+  def to_vertex_map(self, result):
+    """Translate a map from vertex id to edge id (or None) to external objects.
+
+    This converts discovery forests and shortest-path trees computed on the
+    CSR graph into the Vertex-to-Edge maps returned by the Graph algorithms.
+    """
+    return {self.vertex(v): (None if e is None else self.edge(e))
+            for v, e in result.items()}
+
+  def to_distance_map(self, result):
+    """Translate a map from vertex id to distance into one keyed by vertex."""
+    return {self.vertex(v): d for v, d in result.items()}
+
+#------------------------- nonpublic utilities -------------------------
+def _typecode(part):
+  """Return the typecode of an array or the format of a memoryview."""
+  return part.typecode if isinstance(part, array) else part.format
+
+def _weight_array(elements):
+  """Return an array of the numeric elements, or None if any is not a number."""
+  if all(type(x) is int for x in elements):
+    try:
+      return array('q', elements)
+    except OverflowError:                       # too large for machine words
+      pass
+  if all(type(x) in (int, float) for x in elements):
+    return array('d', elements)
+  return None
+
+def _slot_weights(weight, eid):
+  """Return the weight array reordered to follow the slots of a row set."""
+  if weight is None:
+    return None
+  return array(weight.typecode, (weight[k] for k in eid))
+
+def _build_rows(n, tails, heads, weight, directed):
+  """Return (offsets, target, eid, weight) rows built by a counting sort.
+
+  Edges keep their relative (id) order within each row.  An undirected
+  self-loop is listed once in the row of its vertex.
+  """
+  count = array('q', bytes(8 * (n+1)))         # zero-filled
+  for u in tails:
+    count[u+1] += 1
+  if not directed:
+    for k in range(len(heads)):
+      if heads[k] != tails[k]:
+        count[heads[k]+1] += 1
+  for i in range(n):                            # prefix sums become offsets
+    count[i+1] += count[i]
+  offsets = array('q', count)
+  size = offsets[n]
+  target = array('q', bytes(8 * size))
+  eid = array('q', bytes(8 * size))
+  free = count                                  # next free slot in each row
+  for k in range(len(tails)):
+    u = tails[k]
+    v = heads[k]
+    slot = free[u]
+    target[slot] = v
+    eid[slot] = k
+    free[u] = slot + 1
+    if not directed and v != u:
+      slot = free[v]
+      target[slot] = u
+      eid[slot] = k
+      free[v] = slot + 1
+  return offsets, target, eid, _slot_weights(weight, eid)
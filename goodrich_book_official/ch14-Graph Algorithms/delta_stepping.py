@@ -0,0 +1,158 @@
+# Description: 
+
+import os
+from multiprocessing import Pool
+from multiprocessing.sharedctypes import RawArray
+
+from .csr_graph import CSRGraph
+
+# Delta-stepping single-source shortest paths (Meyer and Sanders) over the
+# rows of a weighted CSRGraph.  Tentative distances are grouped into buckets
+# of width delta.  The lowest nonempty bucket is settled in phases: first the
+# light edges (weight at most delta) of its vertices are relaxed, repeatedly,
+# since they may refill the bucket, and then the heavy edges of all vertices
+# it settled.  Within a phase every vertex is independent, so the relaxation
+# requests of a large frontier are generated in parallel chunks by a process
+# pool that reads the rows and the current distances from shared memory; this
+# process then applies the requests, keeping the minimum for each target.
+
+PARALLEL_THRESHOLD = 2048       # smaller frontiers are expanded in this process
+
+def delta_stepping_shortest_path_lengths(g, src, delta=None, processes=None):
+  """Compute shortest-path distances from src to reachable vertices of g.
+
+  Graph g must be weighted with non-negative numbers.  Return dictionary
+  mapping each reachable vertex to its distance from src, as for
+  shortest_paths.shortest_path_lengths(g, src, lazy=True).  See
+  delta_stepping for delta and processes.
+  """
+  csr = CSRGraph.from_graph(g)
+  return csr.to_distance_map(delta_stepping(csr, csr.index(src), delta, processes))
+
+def delta_stepping(csr, src, delta=None, processes=None):
+  """Compute shortest-path distances from id src to reachable vertex ids.
+
+  The CSR graph must be weighted with non-negative numbers.  delta is the
+  bucket width, by default the mean edge weight.  Frontiers of at least
+  PARALLEL_THRESHOLD vertices are expanded by a pool of the given number of
+  processes (one per CPU by default); with processes=1, or for a small
+  graph, all work is done in this process.
+
+  Return dictionary mapping each reachable vertex id to its distance from
+  src, as for csr_algorithms.shortest_path_lengths with reachable_only=True.
+  """
+  offsets, target, _, weight = csr.rows()
+  if weight is None:
+    raise ValueError('graph must have numeric edge weights')
+  n = csr.vertex_count()
+  if delta is None:
+    delta = sum(weight) / len(weight) if len(weight) else 1
+    if delta <= 0:
+      delta = 1                                 # all weights are zero
+  elif delta <= 0:
+    raise ValueError('delta must be positive')
+  dist = RawArray('d', n)                       # tentative distances, shared
+  inf = float('inf')
+  dist[:] = [inf] * n
+  pool = None
+  if processes != 1 and len(target) >= PARALLEL_THRESHOLD:
+    workers = processes or os.cpu_count() or 1
+    shared = []
+    for part in (offsets, target, weight):
+      copy = RawArray('d' if part is weight else 'q', len(part))
+      copy[:] = part
+      shared.append(copy)
+    pool = Pool(workers, _init_worker, tuple(shared) + (dist, delta))
+  _init_worker(offsets, target, weight, dist, delta)  # for work done here
+
+  def expand(frontier, light):
+    """Return relaxation requests from the frontier along light (or heavy) edges."""
+    if pool is None or len(frontier) < PARALLEL_THRESHOLD:
+      return [_requests((frontier, light))]
+    size = -(-len(frontier) // (4 * workers))   # a few chunks per worker
+    chunks = [(frontier[i:i + size], light) for i in range(0, len(frontier), size)]
+    return pool.map(_requests, chunks)
+
+  buckets = {}                                  # bucket index -> set of vertices
+
+  def relax(parts):
+    """Apply the relaxation requests of parts, filing improved vertices."""
+    for requests in parts:
+      for v, alt in requests.items():
+        old = dist[v]
+        if alt < old:
+          members = buckets.get(int(old // delta)) if old != inf else None
+          if members is not None:               # bucket being settled was popped
+            members.discard(v)
+          dist[v] = alt
+          buckets.setdefault(int(alt // delta), set()).add(v)
+
+  try:
+    dist[src] = 0
+    buckets[0] = {src}
+    while buckets:
+      i = min(buckets)
+      current = buckets.pop(i)                  # may have been emptied by discards
+      settled = {}                              # insertion-ordered set
+      while current:                            # light edges may refill bucket i
+        frontier = list(current)
+        settled.update(dict.fromkeys(frontier))
+        relax(expand(frontier, True))
+        current = buckets.pop(i, None)
+      if settled:
+        relax(expand(list(settled), False))     # heavy edges lead past bucket i
+  finally:
+    if pool is not None:
+      pool.close()
+      pool.join()
+    _init_worker(None, None, None, None, None)  # release the rows held here
+  integral = len(weight) == 0 or type(weight[0]) is int
+  return {v: (int(d) if integral else d) for v, d in enumerate(dist) if d != inf}
+
+#------------------------- nonpublic utilities -------------------------
+_offsets = _target = _weight = _dist = _delta = None  # per-process scan state
+
+def _init_worker(offsets, target, weight, dist, delta):
+  """Install the rows and shared distances read by a process."""
+  global _offsets, _target, _weight, _dist, _delta
+  _offsets, _target, _weight, _dist, _delta = offsets, target, weight, dist, delta
+
+def _requests(task):
+  """Return map from vertex to the best improved distance offered by a frontier.
+
+  task is a (frontier, light) pair; only light edges (weight at most delta)
+  are followed if light is True, and only heavy ones otherwise.
+  """
+  frontier, light = task
+  offsets, target, weight, dist, delta = _offsets, _target, _weight, _dist, _delta
+  best = {}
+  for u in frontier:
+    du = dist[u]
+    for slot in range(offsets[u], offsets[u+1]):
+      w = weight[slot]
+      if (w <= delta) == light:
+        v = target[slot]
+        alt = du + w
+        if alt < dist[v] and alt < best.get(v, alt + 1):
+          best[v] = alt
+  return best
+
+if __name__ == '__main__':
+  import sys
+  from time import perf_counter
+  from .csr_algorithms import shortest_path_lengths
+  from .graph_generators import erdos_renyi_graph
+  try:
+    n = int(sys.argv[1])
+  except (IndexError, ValueError):
+    n = 100000
+  csr = CSRGraph.from_graph(erdos_renyi_graph(n, 4 * n, seed=n))
+  start = perf_counter()
+  expected = shortest_path_lengths(csr, 0, reachable_only=True)
+  print('dijkstra             {0:.3f}s'.format(perf_counter() - start))
+  for processes in (1, None):
+    start = perf_counter()
+    result = delta_stepping(csr, 0, processes=processes)
+    print('delta-stepping ({0}) {1:.3f}s'.format(
+      'pool' if processes is None else 'one', perf_counter() - start))
+    assert result == expected, 'distance maps differ'
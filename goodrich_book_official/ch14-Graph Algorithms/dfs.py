@@ -13,6 +13,25 @@ def DFS(g, u, discovered):
       discovered[v] = e            # e is the tree edge that discovered v
       DFS(g, v, discovered)        # recursively explore from v
 
+def DFS_iterative(g, u, discovered):
+  """Perform DFS of the undiscovered portion of Graph g starting at Vertex u.
+
+  This has the same contract as DFS, and discovers vertices in the same
+  order, but keeps an explicit stack of (vertex, edge iterator) pairs rather
+  than recurring, so long paths cannot exceed Python's recursion limit.
+  """
+  stack = [(u, g.incident_edges(u))]
+  while stack:
+    v, edges = stack[-1]
+    for e in edges:                # resume v's edges where we left off
+      w = e.opposite(v)
+      if w not in discovered:      # w is an unvisited vertex
+        discovered[w] = e          # e is the tree edge that discovered w
+        stack.append((w, g.incident_edges(w)))  # explore from w next
+        break
+    else:
+      stack.pop()                  # all edges of v are explored
+
 def construct_path(u, v, discovered):
   """
   Return a list of vertices comprising the directed path from u to v,
@@ -33,15 +52,17 @@ def construct_path(u, v, discovered):
     path.reverse()                 # reorient path from u to v
   return path
 
-def DFS_complete(g):
+def DFS_complete(g, iterative=False):
   """Perform DFS for entire graph and return forest as a dictionary.
 
   Result maps each vertex v to the edge that was used to discover it.
   (Vertices that are roots of a DFS tree are mapped to None.)
+  If iterative is True, DFS_iterative is used for each tree.
   """
+  search = DFS_iterative if iterative else DFS
   forest = {}
   for u in g.vertices():
     if u not in forest:
       forest[u] = None             # u will be the root of a tree
-      DFS(g, u, forest)
+      search(g, u, forest)
   return forest
@@ -0,0 +1,160 @@
+# Description: 
+
+from time import perf_counter
+
+# Level-synchronous BFS that switches between top-down and bottom-up
+# expansion of each level (Beamer, Asanovic and Patterson).  Top-down scans
+# the edges leaving the frontier; bottom-up lets every undiscovered vertex
+# scan its incoming edges until it finds a parent in the frontier, which is
+# far cheaper once the frontier holds a large part of the graph.
+#
+# The result is a BFS forest in the same format as bfs.BFS: every vertex is
+# discovered at the same level as by bfs.BFS, although a vertex with several
+# parents in the previous level may be assigned a different one of them.
+
+ALPHA = 14                      # go bottom-up once frontier edges > unexplored / ALPHA
+BETA = 24                       # go top-down again once frontier < n / BETA
+
+class LevelStats:
+  """Statistics for one level of a direction-optimizing BFS."""
+  __slots__ = 'level', 'direction', 'frontier', 'edges', 'seconds'
+
+  def __init__(self, level, direction, frontier, edges, seconds):
+    self.level = level              # distance of the frontier from the source
+    self.direction = direction      # 'top-down' or 'bottom-up'
+    self.frontier = frontier        # number of vertices in the frontier
+    self.edges = edges              # number of edges examined
+    self.seconds = seconds          # time spent expanding the level
+
+  def __repr__(self):
+    return 'LevelStats({0}, {1!r}, frontier={2}, edges={3}, {4:.6f}s)'.format(
+      self.level, self.direction, self.frontier, self.edges, self.seconds)
+
+def BFS_direction_optimizing(g, s, discovered, alpha=ALPHA, beta=BETA):
+  """Perform BFS of the undiscovered portion of Graph g starting at Vertex s.
+
+  discovered is as for bfs.BFS (s should be mapped to None prior to the call),
+  and frontiers are kept as sets.  Return a list of LevelStats, one per level.
+  """
+  unexplored = sum(g.degree(v, False) for v in g.vertices() if v not in discovered)
+  return _BFS(g, s, discovered, alpha, beta, unexplored)[0]
+
+def _BFS(g, s, discovered, alpha, beta, unexplored):
+  """Return (stats, unexplored) given the count of edges into undiscovered vertices."""
+  n = g.vertex_count()
+  frontier = {s}
+  frontier_edges = g.degree(s)
+  stats = []
+  bottom_up = False
+  level = 0
+  while frontier:
+    start = perf_counter()
+    if not bottom_up and frontier_edges > unexplored / alpha:
+      bottom_up = True                          # frontier has grown large
+    elif bottom_up and len(frontier) < n / beta:
+      bottom_up = False                         # frontier has shrunk again
+    next_level = set()
+    scanned = 0
+    if bottom_up:
+      for v in g.vertices():
+        if v not in discovered:
+          for e in g.incident_edges(v, False):  # consider INCOMING edges
+            scanned += 1
+            if e.opposite(v) in frontier:       # parent found in frontier
+              discovered[v] = e
+              next_level.add(v)
+              break
+    else:
+      for u in frontier:
+        for e in g.incident_edges(u):           # for every outgoing edge from u
+          scanned += 1
+          v = e.opposite(u)
+          if v not in discovered:
+            discovered[v] = e
+            next_level.add(v)
+    frontier_edges = 0
+    for v in next_level:
+      frontier_edges += g.degree(v)
+      unexplored -= g.degree(v, False)
+    stats.append(LevelStats(level, 'bottom-up' if bottom_up else 'top-down',
+                            len(frontier), scanned, perf_counter() - start))
+    frontier = next_level
+    level += 1
+  return stats, unexplored
+
+def BFS_direction_optimizing_complete(g, alpha=ALPHA, beta=BETA):
+  """Perform direction-optimizing BFS for entire graph.
+
+  Return a (forest, stats) pair, where forest is as for bfs.BFS_complete and
+  stats holds the list of LevelStats of each tree, in order.
+  """
+  forest = {}
+  stats = []
+  unexplored = sum(g.degree(v, False) for v in g.vertices())
+  for u in g.vertices():
+    if u not in forest:
+      forest[u] = None                          # u will be a root of a tree
+      unexplored -= g.degree(u, False)
+      tree_stats, unexplored = _BFS(g, u, forest, alpha, beta, unexplored)
+      stats.append(tree_stats)
+  return forest, stats
+
+def csr_BFS_direction_optimizing(csr, s, discovered, alpha=ALPHA, beta=BETA):
+  """Perform direction-optimizing BFS of CSRGraph csr starting at id s.
+
+  discovered is as for csr_algorithms.BFS.  Frontiers are kept as bytearray
+  bitmaps indexed by vertex id.  Return a list of LevelStats, one per level.
+  """
+  out_offsets, out_target, out_eid, _ = csr.rows()
+  in_offsets, in_target, in_eid, _ = csr.rows(False)
+  n = csr.vertex_count()
+  seen = bytearray(n)
+  for v in discovered:
+    seen[v] = 1
+  unexplored = sum(in_offsets[v+1] - in_offsets[v] for v in range(n) if not seen[v])
+  frontier = [s]
+  in_frontier = bytearray(n)
+  in_frontier[s] = 1
+  frontier_edges = out_offsets[s+1] - out_offsets[s]
+  stats = []
+  bottom_up = False
+  level = 0
+  while frontier:
+    start = perf_counter()
+    if not bottom_up and frontier_edges > unexplored / alpha:
+      bottom_up = True
+    elif bottom_up and len(frontier) < n / beta:
+      bottom_up = False
+    next_level = []
+    scanned = 0
+    if bottom_up:
+      for v in range(n):
+        if not seen[v]:
+          for slot in range(in_offsets[v], in_offsets[v+1]):
+            scanned += 1
+            if in_frontier[in_target[slot]]:
+              seen[v] = 1
+              discovered[v] = in_eid[slot]
+              next_level.append(v)
+              break
+    else:
+      for u in frontier:
+        for slot in range(out_offsets[u], out_offsets[u+1]):
+          scanned += 1
+          v = out_target[slot]
+          if not seen[v]:
+            seen[v] = 1
+            discovered[v] = out_eid[slot]
+            next_level.append(v)
+    frontier_edges = 0
+    for u in frontier:
+      in_frontier[u] = 0                        # clear the old bitmap
+    for v in next_level:
+      in_frontier[v] = 1
+      frontier_edges += out_offsets[v+1] - out_offsets[v]
+      unexplored -= in_offsets[v+1] - in_offsets[v]
+    stats.append(LevelStats(level, 'bottom-up' if bottom_up else 'top-down',
+                            len(frontier), scanned, perf_counter() - start))
+    frontier = next_level
+    level += 1
+  return stats
@@ -0,0 +1,156 @@
+# Description: 
+
+from .graph import Graph
+
+class DynamicDAG(Graph):
+  """Directed acyclic graph that maintains a topological order under insertion.
+
+  Each vertex holds a position in the order.  Inserting an edge (u,v) with u
+  already before v costs O(1).  Otherwise only the affected region between
+  the positions of v and u is searched and reordered, following Pearce and
+  Kelly's dynamic topological sort.  An edge that would close a cycle is
+  rejected with a ValueError, leaving the graph unchanged.
+
+  Removals never violate the order; a removed vertex leaves a hole at its
+  position, and holes are compacted once they outnumber the vertices.
+  """
+
+  def __init__(self, indexed=False):
+    """Create an empty directed acyclic graph (see Graph for indexed)."""
+    super().__init__(directed=True, indexed=indexed)
+    self._ord = {}                              # map from vertex to its position
+    self._at = []                               # vertex (or None) at each position
+
+  def topological_order(self):
+    """Return a list of the vertices in topological order."""
+    return [v for v in self._at if v is not None]
+
+  def position(self, v):
+    """Return the position of vertex v in the current topological order.
+
+    Positions increase along the order but may skip holes left by removals.
+    """
+    self._validate_vertex(v)
+    return self._ord[v]
+
+  def insert_vertex(self, x=None):
+    """Insert and return a new Vertex with element x, placed last in the order."""
+    v = super().insert_vertex(x)
+    self._ord[v] = len(self._at)
+    self._at.append(v)
+    return v
+
+  def remove_vertex(self, v):
+    """Remove Vertex v and all of its incident edges; return its element."""
+    x = super().remove_vertex(v)
+    self._at[self._ord.pop(v)] = None           # leave a hole in the order
+    if len(self._at) > 2 * len(self._ord) + 1:
+      self._at = self.topological_order()       # compact, renumbering positions
+      for p, w in enumerate(self._at):
+        self._ord[w] = p
+    return x
+
+  def insert_edge(self, u, v, x=None):
+    """Insert and return a new Edge from u to v with auxiliary element x.
+
+    Raise a ValueError if u and v are not vertices of the graph, if they are
+    already adjacent, or if the edge would create a cycle.
+    """
+    if self.get_edge(u, v) is not None:         # includes error checking
+      raise ValueError('u and v are already adjacent')
+    if u is v:
+      raise ValueError('edge would create a cycle')
+    if self._ord[v] < self._ord[u]:             # order is violated
+      self._reorder(u, v)
+    return super().insert_edge(u, v, x)
+
+  def insert_edges(self, batch, trusted=False):
+    """Insert an iteration of (u,v) or (u,v,x) tuples as new edges.
+
+    Each edge is checked for cycles (and maintains the order) even when
+    trusted is True.  Return the number of edges inserted.
+    """
+    count = 0
+    for e in batch:
+      self.insert_edge(*e)
+      count += 1
+    return count
+
+  #------------------------- nonpublic Pearce-Kelly steps -------------------------
+  def _reorder(self, u, v):
+    """Repair the order before inserting edge (u,v), where v precedes u."""
+    lower = self._ord[v]
+    upper = self._ord[u]
+    forward = self._search(v, upper, True)      # reachable from v, within region
+    if u in forward:
+      raise ValueError('edge would create a cycle')
+    backward = self._search(u, lower, False)    # reaching u, within region
+    # the vertices reaching u must all precede those reachable from v; reuse
+    # exactly their positions, keeping each set's current relative order
+    key = self._ord.__getitem__
+    backward.sort(key=key)
+    forward = sorted(forward, key=key)
+    slots = sorted(key(w) for w in backward + forward)
+    for w, p in zip(backward + forward, slots):
+      self._ord[w] = p
+      self._at[p] = w
+
+  def _search(self, start, bound, outgoing):
+    """Return vertices reached from start along (outgoing) edges within bound.
+
+    Forward searches only enter vertices at positions below bound; backward
+    searches only those above it.
+    """
+    found = {start: None}                       # insertion-ordered set
+    stack = [start]
+    while stack:
+      w = stack.pop()
+      for e in self.incident_edges(w, outgoing):
+        z = e.opposite(w)
+        p = self._ord[z]
+        if z not in found and (p <= bound if outgoing else p >= bound):
+          found[z] = None
+          stack.append(z)
+    return list(found)
+
+if __name__ == '__main__':
+  import sys
+  from random import Random
+  from time import perf_counter
+  from .topological_sort import topological_sort
+  try:
+    n = int(sys.argv[1])
+  except (IndexError, ValueError):
+    n = 2000
+  rand = Random(n)
+  rank = list(range(n))
+  rand.shuffle(rank)                            # hidden order that edges respect
+  pairs = set()
+  while len(pairs) < 3 * n:
+    a, b = rand.randrange(n), rand.randrange(n)
+    if rank[a] < rank[b]:
+      pairs.add((a, b))
+  pairs = list(pairs)
+  rand.shuffle(pairs)
+  batch = max(1, len(pairs) // 100)             # re-sort after each of 100 batches
+
+  dag = DynamicDAG()
+  verts = [dag.insert_vertex(i) for i in range(n)]
+  start = perf_counter()
+  for a, b in pairs:
+    dag.insert_edge(verts[a], verts[b])
+  incremental = perf_counter() - start
+
+  g = Graph(directed=True)
+  verts = [g.insert_vertex(i) for i in range(n)]
+  start = perf_counter()
+  for k, (a, b) in enumerate(pairs, 1):
+    g.insert_edge(verts[a], verts[b])
+    if k % batch == 0 or k == len(pairs):
+      topological_sort(g)
+  full = perf_counter() - start
+
+  order = {v.element(): p for p, v in enumerate(dag.topological_order())}
+  assert all(order[a] < order[b] for a, b in pairs)
+  print('{0} vertices, {1} edges, re-sort every {2} edges'.format(n, len(pairs), batch))
+  print('incremental {0:.3f}s   full recomputation {1:.3f}s'.format(incremental, full))
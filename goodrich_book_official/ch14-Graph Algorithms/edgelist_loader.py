@@ -0,0 +1,208 @@
+# Description: 
+
+import csv
+import mmap
+import struct
+from array import array
+from time import perf_counter
+
+from .graph import Graph
+from .csr_graph import CSRGraph
+
+# Streaming loaders for large edge lists.  Edges are read in chunks of
+# (origin,destination,element) tuples from one of three formats:
+#
+#   'text'    one edge per line, fields separated by whitespace (or delimiter);
+#             blank lines and lines starting with '#' are ignored
+#   'csv'     one edge per row, read with the csv module
+#   'binary'  fixed-size little-endian records of two int64 vertex labels,
+#             followed by one float64 weight if the file is weighted
+#             (see write_binary_edgelist); read through mmap
+
+BINARY_WEIGHTED = struct.Struct('<qqd')
+BINARY_UNWEIGHTED = struct.Struct('<qq')
+
+class LoadStats:
+  """Summary of a bulk load: counts, elapsed time and throughput."""
+  __slots__ = 'vertices', 'edges', 'seconds', 'chunks'
+
+  def __init__(self):
+    self.vertices = 0
+    self.edges = 0
+    self.seconds = 0.0
+    self.chunks = 0
+
+  def edges_per_second(self):
+    """Return the load throughput in edges per second."""
+    return self.edges / self.seconds if self.seconds > 0 else float('inf')
+
+  def __str__(self):
+    return '{0} vertices, {1} edges in {2:.3f}s ({3:.0f} edges/s)'.format(
+      self.vertices, self.edges, self.seconds, self.edges_per_second())
+
+def parse_element(token):
+  """Convert a text field to an int or float if possible (else keep it)."""
+  try:
+    return int(token)
+  except ValueError:
+    try:
+      return float(token)
+    except ValueError:
+      return token
+
+#------------------------- chunked readers -------------------------
+def read_edge_chunks(path, fmt='text', delimiter=None, element=parse_element,
+                     chunk_size=65536, weighted=True):
+  """Generate lists of (origin,destination,element) tuples read from a file.
+
+  Each list holds at most chunk_size edges.  The element conversion is applied
+  to a third field when present (an edge without one gets element None).
+  Raise a ValueError, naming the line, for a row with fewer than two fields.
+  For the binary format, weighted states whether records carry a weight.
+  """
+  if fmt == 'binary':
+    yield from _binary_chunks(path, chunk_size, weighted)
+    return
+  with open(path, newline='' if fmt == 'csv' else None) as fp:
+    if fmt == 'csv':
+      reader = csv.reader(fp, delimiter=delimiter or ',')
+      rows = ((reader.line_num, row) for row in reader if row)
+    elif fmt == 'text':
+      rows = ((number, line.rstrip('\r\n').split(delimiter))
+              for number, line in enumerate(fp, 1)
+              if line.strip() and not line.startswith('#'))
+    else:
+      raise ValueError('unknown edge list format: ' + repr(fmt))
+    chunk = []
+    for number, row in rows:
+      if len(row) < 2:
+        raise ValueError('line {0} has fewer than two fields: {1!r}'.format(number, row))
+      if len(row) > 2:
+        chunk.append((row[0], row[1], element(row[2])))
+      else:
+        chunk.append((row[0], row[1], None))
+      if len(chunk) == chunk_size:
+        yield chunk
+        chunk = []
+    if chunk:
+      yield chunk
+
+def _binary_chunks(path, chunk_size, weighted):
+  """Generate chunks of edge tuples from a binary edge list through mmap."""
+  record = BINARY_WEIGHTED if weighted else BINARY_UNWEIGHTED
+  with open(path, 'rb') as fp:
+    if fp.seek(0, 2) == 0:
+      return                                    # empty file cannot be mapped
+    with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+      if len(mm) % record.size != 0:
+        raise ValueError('binary edge list has a truncated record')
+      step = record.size * chunk_size
+      view = memoryview(mm)
+      try:
+        for start in range(0, len(mm), step):
+          if weighted:
+            chunk = list(record.iter_unpack(view[start:start+step]))
+          else:
+            chunk = [(u, v, None) for u, v in record.iter_unpack(view[start:start+step])]
+          yield chunk
+      finally:
+        view.release()                          # mmap cannot close while exported
+
+def write_binary_edgelist(path, E, weighted=True):
+  """Write (origin,destination[,weight]) tuples with integer labels to path."""
+  record = BINARY_WEIGHTED if weighted else BINARY_UNWEIGHTED
+  with open(path, 'wb') as fp:
+    for e in E:
+      if weighted:
+        fp.write(record.pack(e[0], e[1], e[2]))
+      else:
+        fp.write(record.pack(e[0], e[1]))
+
+#------------------------- bulk loaders -------------------------
+def load_graph(path, directed=False, fmt='text', trusted=False, g=None, **options):
+  """Stream an edge list file into a Graph; return (graph, LoadStats).
+
+  Vertex labels are interned in a single pass through the graph's element
+  index, each distinct label becoming one Vertex (with the label as its
+  element).  By default each edge is validated as by insert_edge, so a
+  repeated edge (including both orientations of an undirected edge) raises a
+  ValueError.  If trusted is True, each chunk is inserted without the per-edge
+  validation, and a repeated edge is skipped, keeping the first.  An existing
+  graph g may be extended, provided that its vertex elements are distinct; it
+  is indexed if it was not already.  Remaining keyword options are passed to
+  read_edge_chunks.
+  """
+  start = perf_counter()
+  if g is None:
+    g = Graph(directed, indexed=True)
+  elif not g.is_indexed():
+    g.index_vertices()
+  vertex = g.get_or_insert_vertex
+  stats = LoadStats()
+  for chunk in read_edge_chunks(path, fmt, **options):
+    batch = []
+    for u, v, x in chunk:
+      batch.append((vertex(u), vertex(v), x))
+    stats.edges += g.insert_edges(batch, trusted)
+    stats.chunks += 1
+  stats.vertices = g.vertex_count()
+  stats.seconds = perf_counter() - start
+  return g, stats
+
+def load_csr(path, directed=False, fmt='text', **options):
+  """Stream an edge list file into a CSRGraph; return (graph, LoadStats).
+
+  Labels are interned to integer ids in order of first appearance, and the
+  edges are kept in flat arrays rather than as per-edge Python objects.
+  Remaining keyword options are passed to read_edge_chunks.
+  """
+  start = perf_counter()
+  index = {}                                    # map from label to vertex id
+  origin = array('q')
+  destination = array('q')
+  weight = array('q')                           # widened to 'd' on first float
+  weighted = None                               # decided by the first edge
+  stats = LoadStats()
+  for chunk in read_edge_chunks(path, fmt, **options):
+    for u, v, x in chunk:
+      a = index.get(u)
+      if a is None:
+        a = index[u] = len(index)
+      b = index.get(v)
+      if b is None:
+        b = index[v] = len(index)
+      origin.append(a)
+      destination.append(b)
+      if weighted is None:
+        weighted = x is not None
+      if weighted:
+        if type(x) is float and weight.typecode == 'q':
+          weight = array('d', weight)
+        try:
+          weight.append(x)
+        except TypeError:
+          raise ValueError('CSR graphs need numeric edge elements (or none at all); '
+                           'edge {0!r}'.format((u, v, x)))
+        except OverflowError:
+          raise ValueError('edge weight does not fit in 64 bits; '
+                           'edge {0!r}'.format((u, v, x)))
+      elif x is not None:
+        raise ValueError('CSR graphs need numeric edge elements (or none at all); '
+                         'edge {0!r}'.format((u, v, x)))
+    stats.chunks += 1
+  csr = CSRGraph.from_arrays(len(index), origin, destination,
+                             weight if weighted else None, directed, list(index))
+  stats.vertices = len(index)
+  stats.edges = len(origin)
+  stats.seconds = perf_counter() - start
+  return csr, stats
+
+if __name__ == '__main__':
+  import sys
+  if len(sys.argv) < 2:
+    print('usage: edgelist_loader.py path [text|csv|binary] [directed]')
+  else:
+    fmt = sys.argv[2] if len(sys.argv) > 2 else 'text'
+    directed = len(sys.argv) > 3 and sys.argv[3] == 'directed'
+    print('Graph:', load_graph(sys.argv[1], directed, fmt)[1])
+    print('CSR:  ', load_csr(sys.argv[1], directed, fmt)[1])
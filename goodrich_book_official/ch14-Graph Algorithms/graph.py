@@ -55,14 +55,19 @@ class Graph:
       return '({0},{1},{2})'.format(self._origin,self._destination,self._element)
     
   #------------------------- Graph methods -------------------------
-  def __init__(self, directed=False):
+  def __init__(self, directed=False, indexed=False):
     """Create an empty graph (undirected, by default).
 
     Graph is directed if optional paramter is set to True.
+    Graph keeps a map from element to vertex if indexed is set to True, in
+    which case vertex elements must be hashable and distinct.
     """
     self._outgoing = {}
     # only create second map for directed graph; use alias for undirected
     self._incoming = {} if directed else self._outgoing
+    self._index = {} if indexed else None     # map from element to vertex
+    self._edge_count = 0
+    self._version = 0                         # bumped by every change
 
   def _validate_vertex(self, v):
     """Verify that v is a Vertex of this graph."""
@@ -70,6 +75,14 @@ class Graph:
       raise TypeError('Vertex expected')
     if v not in self._outgoing:
       raise ValueError('Vertex does not belong to this graph.')
+
+  def _validate_edge(self, e):
+    """Verify that e is an Edge of this graph."""
+    if not isinstance(e, self.Edge):
+      raise TypeError('Edge expected')
+    secondary_map = self._outgoing.get(e._origin)
+    if secondary_map is None or secondary_map.get(e._destination) is not e:
+      raise ValueError('Edge does not belong to this graph.')
     
   def is_directed(self):
     """Return True if this is a directed graph; False if undirected.
@@ -78,6 +91,42 @@ class Graph:
     """
     return self._incoming is not self._outgoing # directed if maps are distinct
 
+  def is_indexed(self):
+    """Return True if the graph keeps a map from element to vertex."""
+    return self._index is not None
+
+  def index_vertices(self):
+    """Start keeping a map from element to vertex, built from current vertices.
+
+    Raise a ValueError if two vertices have the same element.
+    """
+    index = {}
+    for v in self._outgoing:
+      if v._element in index:
+        raise ValueError('vertex elements are not distinct')
+      index[v._element] = v
+    self._index = index
+
+  def find_vertex(self, x):
+    """Return the vertex with element x, or None if there is none.
+
+    This takes O(1) expected time for an indexed graph; otherwise all
+    vertices are scanned.
+    """
+    if self._index is not None:
+      return self._index.get(x)
+    for v in self._outgoing:
+      if v._element == x:
+        return v
+    return None
+
+  def get_or_insert_vertex(self, x):
+    """Return the vertex with element x, inserting a new one if there is none."""
+    v = self.find_vertex(x)
+    if v is None:
+      v = self.insert_vertex(x)
+    return v
+
   def vertex_count(self):
     """Return the number of vertices in the graph."""
     return len(self._outgoing)
@@ -88,9 +137,11 @@ class Graph:
 
   def edge_count(self):
     """Return the number of edges in the graph."""
-    total = sum(len(self._outgoing[v]) for v in self._outgoing)
-    # for undirected graphs, make sure not to double-count edges
-    return total if self.is_directed() else total // 2
+    return self._edge_count            # maintained by insertions and removals
+
+  def version(self):
+    """Return a counter that increases whenever a vertex or edge is inserted or removed."""
+    return self._version
 
   def edges(self):
     """Return a set of all edges of the graph."""
@@ -125,11 +176,19 @@ class Graph:
       yield edge
 
   def insert_vertex(self, x=None):
-    """Insert and return a new Vertex with element x."""
+    """Insert and return a new Vertex with element x.
+
+    Raise a ValueError if the graph is indexed and x is already an element.
+    """
+    if self._index is not None and x in self._index:
+      raise ValueError('element already belongs to a vertex')
     v = self.Vertex(x)
     self._outgoing[v] = {}
     if self.is_directed():
       self._incoming[v] = {}        # need distinct map for incoming edges
+    if self._index is not None:
+      self._index[x] = v
+    self._version += 1
     return v
       
   def insert_edge(self, u, v, x=None):
@@ -143,3 +202,82 @@ class Graph:
     e = self.Edge(u, v, x)
     self._outgoing[u][v] = e
     self._incoming[v][u] = e
+    self._edge_count += 1
+    self._version += 1
+    return e
+
+  def insert_edges(self, batch, trusted=False):
+    """Insert an iteration of (u,v) or (u,v,x) tuples as new edges.
+
+    Return the number of edges inserted.  If trusted is True, the caller
+    guarantees that u and v are vertices of this graph, and the per-edge
+    checks made by insert_edge are skipped; an edge joining vertices that are
+    already adjacent is skipped rather than inserted (nor counted).
+    """
+    count = 0
+    if not trusted:
+      for e in batch:
+        self.insert_edge(*e)                  # includes error checking
+        count += 1
+      return count
+    outgoing = self._outgoing                 # local names for speed
+    incoming = self._incoming
+    Edge = self.Edge
+    for e in batch:
+      u = e[0]
+      v = e[1]
+      if v in outgoing[u]:
+        continue                              # keep the existing edge
+      edge = Edge(u, v, e[2] if len(e) > 2 else None)
+      outgoing[u][v] = edge
+      incoming[v][u] = edge
+      count += 1
+    self._edge_count += count
+    self._version += 1
+    return count
+
+  def remove_edge(self, e):
+    """Remove Edge e from the graph and return its element.
+
+    Raise a ValueError if e is not an edge of the graph.
+    """
+    self._validate_edge(e)
+    u, v = e._origin, e._destination
+    del self._outgoing[u][v]
+    self._incoming[v].pop(u, None)     # already gone for undirected self-loop
+    self._edge_count -= 1
+    self._version += 1
+    return e._element
+
+  def remove_vertex(self, v):
+    """Remove Vertex v and all of its incident edges; return its element.
+
+    Takes time proportional to the degree of v.
+    Raise a ValueError if v is not a vertex of the graph.
+    """
+    self._validate_vertex(v)
+    outgoing = self._outgoing.pop(v)
+    for w in outgoing:
+      if w is not v:
+        del self._incoming[w][v]       # edge (v,w) as seen from w
+    removed = len(outgoing)
+    if self.is_directed():
+      incoming = self._incoming.pop(v)
+      for w in incoming:
+        if w is not v:                 # a self-loop was counted as outgoing
+          del self._outgoing[w][v]
+          removed += 1
+    self._edge_count -= removed
+    if self._index is not None:
+      del self._index[v._element]
+    self._version += 1
+    return v._element
+
+  def save(self, path):
+    """Write a binary snapshot of the graph to path.
+
+    The snapshot reloads as a read-only CSR view through CSRGraph.load(path),
+    with vertex elements as labels and numeric edge elements as weights.
+    """
+    from .csr_graph import CSRGraph      # only needed for snapshots
+    CSRGraph.from_graph(self).save(path)
@@ -0,0 +1,125 @@
+# Description: 
+
+import json
+import platform
+import sys
+import tracemalloc
+from time import perf_counter
+
+from .bfs import BFS_complete
+from .dfs import DFS_complete
+from .graph_generators import erdos_renyi_graph, grid_graph, power_law_graph, random_dag
+from .mst import MST_PrimJarnik, MST_Kruskal
+from .shortest_paths import shortest_path_lengths, bucket_shortest_path_lengths
+from .topological_sort import topological_sort
+from .transitive_closure import floyd_warshall
+
+# Benchmark suite for the ch14 algorithms on seeded synthetic graphs.  Each
+# (graph, algorithm) pair is timed (best of several runs) and then run once
+# more under tracemalloc to record its peak memory.  Results are plain dicts,
+# written as JSON so that runs can be compared with regressions().
+#
+#   python -m <package>.graph_benchmark [n] [output.json] [baseline.json]
+
+FLOYD_WARSHALL_LIMIT = 60       # floyd_warshall is cubic; run on smaller graphs
+
+ALGORITHMS = (                  # (name, function, applies to directed, undirected)
+  ('BFS_complete', BFS_complete, True, True),
+  ('DFS_complete', lambda g: DFS_complete(g, iterative=True), True, True),
+  ('dijkstra', lambda g: shortest_path_lengths(g, _first(g), weight_limit=0), True, True),
+  ('dijkstra_bucket', lambda g: bucket_shortest_path_lengths(g, _first(g)), True, True),
+  ('dijkstra_lazy', lambda g: shortest_path_lengths(g, _first(g), lazy=True), True, True),
+  ('MST_PrimJarnik', MST_PrimJarnik, False, True),
+  ('MST_Kruskal', MST_Kruskal, False, True),
+  ('topological_sort', topological_sort, True, False),
+  ('floyd_warshall', floyd_warshall, True, True),
+  )
+
+def graph_families(n, seed=0):
+  """Return a list of (name, graph) pairs of about n vertices each."""
+  side = max(2, int(n ** 0.5))
+  return [
+    ('erdos_renyi', erdos_renyi_graph(n, 4 * n, seed=seed)),
+    ('grid', grid_graph(side, side, seed=seed)),
+    ('power_law', power_law_graph(n, 3, seed=seed)),
+    ('dag', random_dag(n, 4 * n, seed=seed)),
+    ]
+
+def measure(f, g, repeat=3):
+  """Return (best seconds, peak bytes) of running f(g)."""
+  best = float('inf')
+  for _ in range(repeat):
+    start = perf_counter()
+    f(g)
+    best = min(best, perf_counter() - start)
+  tracemalloc.start()                           # separate run; tracing slows f
+  try:
+    f(g)
+    peak = tracemalloc.get_traced_memory()[1]
+  finally:
+    tracemalloc.stop()
+  return best, peak
+
+def run_benchmarks(n, seed=0, repeat=3, algorithms=None):
+  """Benchmark the ch14 algorithms on each graph family of about n vertices.
+
+  floyd_warshall runs on graphs of at most FLOYD_WARSHALL_LIMIT vertices
+  instead.  algorithms optionally restricts the run to the named algorithms.
+  Return a dict with the run's parameters and a list of per-(graph,
+  algorithm) results.
+  """
+  chosen = [a for a in ALGORITHMS if algorithms is None or a[0] in algorithms]
+  small = [a for a in chosen if a[1] is floyd_warshall]
+  plan = [(n, [a for a in chosen if a[1] is not floyd_warshall])]
+  plan.append((min(n, FLOYD_WARSHALL_LIMIT), small))
+  results = []
+  for size, selected in plan:
+    if not selected:
+      continue
+    for family, g in graph_families(size, seed):
+      for name, f, directed, undirected in selected:
+        if directed if g.is_directed() else undirected:
+          seconds, peak = measure(f, g, repeat)
+          results.append({'graph': family, 'algorithm': name,
+                          'vertices': g.vertex_count(), 'edges': g.edge_count(),
+                          'seconds': seconds, 'peak_bytes': peak})
+  return {'n': n, 'seed': seed, 'repeat': repeat,
+          'python': platform.python_version(), 'results': results}
+
+def regressions(before, after, tolerance=1.25):
+  """Return the results of run after that are slower than in run before.
+
+  Return a list of (graph, algorithm, ratio) tuples for every result whose
+  time grew by more than a factor of tolerance.
+  """
+  old = {(r['graph'], r['algorithm']): r['seconds'] for r in before['results']}
+  slower = []
+  for r in after['results']:
+    key = (r['graph'], r['algorithm'])
+    if key in old and old[key] > 0:
+      ratio = r['seconds'] / old[key]
+      if ratio > tolerance:
+        slower.append(key + (ratio,))
+  return slower
+
+#------------------------- nonpublic utilities -------------------------
+def _first(g):
+  """Return an arbitrary (the first) vertex of g."""
+  return next(iter(g.vertices()))
+
+if __name__ == '__main__':
+  try:
+    n = int(sys.argv[1])
+  except (IndexError, ValueError):
+    n = 2000
+  report = run_benchmarks(n)
+  for r in report['results']:
+    print('{0:<12} {1:<17} n={2:<7} m={3:<8} {4:8.4f}s {5:>12,} bytes'.format(
+      r['graph'], r['algorithm'], r['vertices'], r['edges'], r['seconds'], r['peak_bytes']))
+  if len(sys.argv) > 2:
+    with open(sys.argv[2], 'w') as fp:
+      json.dump(report, fp, indent=2)
+  if len(sys.argv) > 3:
+    with open(sys.argv[3]) as fp:
+      for graph, name, ratio in regressions(json.load(fp), report):
+        print('regression: {0} on {1} is {2:.2f}x slower'.format(name, graph, ratio))
@@ -2,31 +2,25 @@
 
 from .graph import Graph
 
-def graph_from_edgelist(E, directed=False):
+def graph_from_edgelist(E, directed=False, trusted=False):
   """Make a graph instance based on a sequence of edge tuples.
 
   Edges can be either of from (origin,destination) or
   (origin,destination,element). Vertex set is presume to be those
   incident to at least one edge.
 
-  vertex labels are assumed to be hashable.
+  vertex labels are assumed to be hashable.  If trusted is True, per-edge
+  validation is skipped and a repeated edge is ignored, keeping the first.
   """
-  g = Graph(directed)
-  V = set()
-  for e in E:
-    V.add(e[0])
-    V.add(e[1])
-
-  verts = {}  # map from vertex label to Vertex instance
-  for v in V:
-    verts[v] = g.insert_vertex(v)
-
-  for e in E:
-    src = e[0]
-    dest = e[1]
+  g = Graph(directed, indexed=True)   # graph maps each label to its Vertex
+  batch = []
+  for e in E:                     # intern labels in the same single pass
+    src = g.get_or_insert_vertex(e[0])
+    dest = g.get_or_insert_vertex(e[1])
     element = e[2] if len(e) > 2 else None
-    g.insert_edge(verts[src],verts[dest],element)
+    batch.append((src, dest, element))
 
+  g.insert_edges(batch, trusted)
   return g
 
 def figure_14_3():
@@ -0,0 +1,88 @@
+# Description: 
+
+from random import Random
+
+from .graph import Graph
+
+# Seeded generators of synthetic weighted graphs, for benchmarks and tests.
+# Vertices are labelled 0, 1, ..., n-1 and edge elements are integer weights
+# drawn uniformly from 1..max_weight.  The same arguments (including seed)
+# always produce the same graph.
+
+def erdos_renyi_graph(n, m, directed=False, seed=0, max_weight=100):
+  """Return a uniformly random simple graph with n vertices and m edges."""
+  if m > (n * (n - 1) if directed else n * (n - 1) // 2):
+    raise ValueError('too many edges for a simple graph')
+  rand = Random(seed)
+  seen = set()
+  E = []
+  while len(E) < m:
+    u = rand.randrange(n)
+    v = rand.randrange(n)
+    if u != v and (u, v) not in seen and (directed or (v, u) not in seen):
+      seen.add((u, v))
+      E.append((u, v, rand.randint(1, max_weight)))
+  return _graph(n, E, directed)
+
+def grid_graph(rows, cols, seed=0, max_weight=100):
+  """Return an undirected rows x cols grid, vertex r*cols+c at row r, column c."""
+  rand = Random(seed)
+  E = []
+  for r in range(rows):
+    for c in range(cols):
+      v = r * cols + c
+      if c + 1 < cols:
+        E.append((v, v + 1, rand.randint(1, max_weight)))
+      if r + 1 < rows:
+        E.append((v, v + cols, rand.randint(1, max_weight)))
+  return _graph(rows * cols, E, False)
+
+def power_law_graph(n, k=2, seed=0, max_weight=100):
+  """Return an undirected preferential-attachment graph with n vertices.
+
+  Following Barabasi and Albert, each vertex after the first k joins with k
+  edges to distinct earlier vertices, chosen with probability proportional
+  to their degree, so that degrees follow a power law.
+  """
+  if not 1 <= k < n:
+    raise ValueError('k must be at least 1 and less than n')
+  rand = Random(seed)
+  E = []
+  ends = list(range(k))                         # each vertex once per incident edge
+  for v in range(k, n):
+    targets = set()
+    while len(targets) < k:
+      targets.add(rand.choice(ends))
+    for u in sorted(targets):
+      E.append((u, v, rand.randint(1, max_weight)))
+      ends.append(u)
+      ends.append(v)
+  return _graph(n, E, False)
+
+def random_dag(n, m, seed=0, max_weight=100):
+  """Return a random directed acyclic graph with n vertices and m edges.
+
+  Edges lead from lower to higher positions of a hidden random order.
+  """
+  if m > n * (n - 1) // 2:
+    raise ValueError('too many edges for a simple DAG')
+  rand = Random(seed)
+  rank = list(range(n))
+  rand.shuffle(rank)
+  seen = set()
+  E = []
+  while len(E) < m:
+    u = rand.randrange(n)
+    v = rand.randrange(n)
+    if rank[u] < rank[v] and (u, v) not in seen:
+      seen.add((u, v))
+      E.append((u, v, rand.randint(1, max_weight)))
+  return _graph(n, E, True)
+
+#------------------------- nonpublic utilities -------------------------
+def _graph(n, E, directed):
+  """Return a graph with vertices 0..n-1 (in order) and the edges of E."""
+  g = Graph(directed, indexed=True)
+  verts = [g.insert_vertex(v) for v in range(n)]  # isolated vertices are kept too
+  g.insert_edges(((verts[u], verts[v], x) for u, v, x in E), True)
+  return g
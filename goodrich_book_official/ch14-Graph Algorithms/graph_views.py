@@ -0,0 +1,153 @@
+# Description: 
+
+from copy import deepcopy
+from .graph import Graph
+
+# Read-only views of a Graph that share its Vertex and Edge instances.  A
+# view supports the query methods of Graph that the ch14 algorithms use
+# (is_directed, vertex_count, vertices, edge_count, edges, get_edge, degree
+# and incident_edges), computing its answers from the underlying graph on
+# each call, so later changes to the graph show through.  Edge.endpoints()
+# still reports each edge's orientation in the underlying graph; algorithms
+# should rely on incident_edges and opposite, as the ch14 traversals do.
+#
+# A deep copy of a view (as made by transitive_closure.floyd_warshall) is an
+# independent Graph; see GraphView.to_graph.
+
+class GraphView:
+  """Base class of read-only graph views."""
+
+  def __init__(self, g):
+    """Create a view of graph g (or of another view)."""
+    self._g = g
+
+  def graph(self):
+    """Return the underlying graph."""
+    return self._g
+
+  def is_directed(self):
+    """Return True if this is a directed graph; False if undirected."""
+    return self._g.is_directed()
+
+  def edges(self):
+    """Return a set of all edges of the view."""
+    result = set()
+    for v in self.vertices():
+      result.update(self.incident_edges(v))
+    return result
+
+  def edge_count(self):
+    """Return the number of edges in the view."""
+    total = sum(self.degree(v) for v in self.vertices())
+    if self.is_directed():
+      return total
+    loops = sum(1 for v in self.vertices() if self.get_edge(v, v) is not None)
+    return (total + loops) // 2                 # a self-loop is listed once
+
+  def to_graph(self):
+    """Return an independent Graph copy of the view, with new vertices and edges.
+
+    Vertex and edge elements are shared with the underlying graph.
+    """
+    return self._copy(lambda x: x)
+
+  def __deepcopy__(self, memo):
+    return self._copy(lambda x: deepcopy(x, memo))
+
+  def _copy(self, element):
+    """Return a Graph copy of the view, copying elements with element(x)."""
+    copy = Graph(self.is_directed())
+    new = {v: copy.insert_vertex(element(v.element())) for v in self.vertices()}
+    for u in self.vertices():
+      for e in self.incident_edges(u):
+        v = e.opposite(u)
+        if copy.get_edge(new[u], new[v]) is None:  # undirected edges are seen twice
+          copy.insert_edge(new[u], new[v], element(e.element()))
+    return copy
+
+class SubgraphView(GraphView):
+  """Read-only view of the subgraph of a graph induced by a set of vertices.
+
+  The view holds the vertex set only; edges are filtered as they are
+  reported.  degree(v) therefore takes time proportional to the degree of v
+  in the underlying graph, and edge_count time proportional to its edges.
+  """
+
+  def __init__(self, g, vertices):
+    """Create a view of the subgraph of g induced by an iteration of its vertices."""
+    super().__init__(g)
+    self._members = {}                          # insertion-ordered vertex set
+    for v in vertices:
+      if v not in self._members:
+        g.degree(v)                             # includes error checking
+        self._members[v] = None
+
+  def _validate_vertex(self, v):
+    """Verify that v is a Vertex of this view."""
+    if v not in self._members:
+      raise ValueError('Vertex does not belong to this view.')
+
+  def __contains__(self, v):
+    """Return True if Vertex v belongs to the view."""
+    return v in self._members
+
+  def vertex_count(self):
+    """Return the number of vertices in the view."""
+    return len(self._members)
+
+  def vertices(self):
+    """Return an iteration of all vertices of the view."""
+    return self._members.keys()
+
+  def get_edge(self, u, v):
+    """Return the edge from u to v, or None if not adjacent."""
+    self._validate_vertex(u)
+    self._validate_vertex(v)
+    return self._g.get_edge(u, v)
+
+  def degree(self, v, outgoing=True):
+    """Return number of (outgoing) edges incident to vertex v in the view."""
+    return sum(1 for e in self.incident_edges(v, outgoing))
+
+  def incident_edges(self, v, outgoing=True):
+    """Return all (outgoing) edges incident to vertex v in the view."""
+    self._validate_vertex(v)
+    members = self._members
+    for e in self._g.incident_edges(v, outgoing):
+      if e.opposite(v) in members:              # skip edges leaving the subset
+        yield e
+
+class ReversedView(GraphView):
+  """Read-only view of a graph with the direction of every edge reversed.
+
+  Each query is answered in O(1) time by asking the underlying graph about
+  the opposite direction; an undirected graph is its own reversal.
+  """
+
+  def vertex_count(self):
+    """Return the number of vertices in the view."""
+    return self._g.vertex_count()
+
+  def vertices(self):
+    """Return an iteration of all vertices of the view."""
+    return self._g.vertices()
+
+  def edge_count(self):
+    """Return the number of edges in the view."""
+    return self._g.edge_count()
+
+  def edges(self):
+    """Return a set of all edges of the view."""
+    return self._g.edges()
+
+  def get_edge(self, u, v):
+    """Return the edge from u to v (that is, from v to u in the graph), or None."""
+    return self._g.get_edge(v, u)
+
+  def degree(self, v, outgoing=True):
+    """Return number of (outgoing) edges incident to vertex v in the view."""
+    return self._g.degree(v, not outgoing)
+
+  def incident_edges(self, v, outgoing=True):
+    """Return all (outgoing) edges incident to vertex v in the view."""
+    return self._g.incident_edges(v, not outgoing)
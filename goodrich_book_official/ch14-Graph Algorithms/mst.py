@@ -1,6 +1,7 @@
 # Description: 
 
-from ..ch09.pq import HeapPriorityQueue,AdaptableHeapPriorityQueue
+from ..ch09.heap_priority_queue import HeapPriorityQueue
+from ..ch09.adaptable_heap_priority_queue import AdaptableHeapPriorityQueue
 from .partition import Partition
 
 def MST_PrimJarnik(g):
@@ -39,16 +40,19 @@ def MST_PrimJarnik(g):
 
   return tree
 
-def MST_Kruskal(g):
+def MST_Kruskal(g, forest=None):
   """Compute a minimum spanning tree of a graph using Kruskal's algorithm.
 
   Return a list of edges that comprise the MST.
 
-  The elements of the graph's edges are assumed to be weights.
+  The elements of the graph's edges are assumed to be weights.  An empty
+  union-find structure may be given as forest (such as an ArrayPartition);
+  by default a new Partition is used.
   """
   tree = []                   # list of edges in spanning tree
   pq = HeapPriorityQueue()    # entries are edges in G, with weights as key
-  forest = Partition()        # keeps track of forest clusters
+  if forest is None:
+    forest = Partition()      # keeps track of forest clusters
   position = {}               # map each node to its Partition entry
 
   for v in g.vertices():
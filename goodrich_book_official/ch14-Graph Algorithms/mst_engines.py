@@ -0,0 +1,122 @@
+# Description: 
+
+import os
+from multiprocessing import Pool
+from multiprocessing.sharedctypes import RawArray
+
+from .csr_algorithms import MST_Kruskal
+from .csr_graph import CSRGraph
+from .partition import ArrayPartition
+
+# Minimum spanning forest engines for large graphs.  Both work on the flat
+# edge arrays of a CSRGraph (Kruskal through csr_algorithms.MST_Kruskal);
+# MST_Kruskal_sorted and MST_Boruvka accept a Graph and return its Edge
+# instances, like mst.MST_Kruskal.
+
+def MST_Kruskal_sorted(g):
+  """Compute a minimum spanning forest of weighted graph g by Kruskal.
+
+  Return a list of edges that comprise the forest.
+  """
+  csr = CSRGraph.from_graph(g)
+  return [csr.edge(e) for e in MST_Kruskal(csr)]
+
+def MST_Boruvka(g, processes=None):
+  """Compute a minimum spanning forest of weighted graph g by Boruvka.
+
+  Return a list of edges that comprise the forest.  See boruvka for the
+  meaning of processes.
+  """
+  csr = CSRGraph.from_graph(g)
+  return [csr.edge(e) for e in boruvka(csr, processes)]
+
+def boruvka(csr, processes=None):
+  """Return the edge ids of a minimum spanning forest of CSR graph csr.
+
+  Each round finds the cheapest edge leaving every component and merges
+  along all of them, so at most log2(n) rounds are needed.  Ties in weight
+  are broken by edge id, which keeps the chosen edges acyclic.
+
+  The cheapest-edge scan of each round is split into ranges of edges that
+  are scanned in parallel by a pool of the given number of processes
+  (one per CPU by default); with processes=1 it runs in this process.
+  """
+  origin, destination, weight = _edge_arrays(csr)
+  n = csr.vertex_count()
+  m = len(origin)
+  forest = ArrayPartition(n)
+  tree = []
+  if processes == 1:
+    pool = None
+    _init_worker(origin, destination, weight, None)
+  else:
+    workers = processes or os.cpu_count() or 1
+    labels = RawArray('q', n)                   # component labels, shared
+    pool = Pool(workers, _init_worker, (origin, destination, weight, labels))
+    size = max(1, -(-m // (4 * workers)))       # a few ranges per worker
+    ranges = [(i, min(i + size, m)) for i in range(0, m, size)]
+  try:
+    while forest.group_count() > 1:
+      comp = forest.find_many()
+      if pool is None:
+        best = _cheapest_edges((0, m), comp)
+      else:
+        labels[:] = comp                        # publish this round's labels
+        best = {}
+        for part in pool.imap_unordered(_cheapest_edges, ranges):
+          _merge_cheapest(best, part)
+      if not best:
+        break                                   # remaining groups disconnected
+      for key in sorted(set(best.values())):    # each edge may be chosen twice
+        e = key[1]
+        if forest.union(origin[e], destination[e]):
+          tree.append(e)
+  finally:
+    if pool is not None:
+      pool.close()
+      pool.join()
+    else:
+      _init_worker(None, None, None, None)      # release the arrays held here
+  return tree
+
+#------------------------- nonpublic utilities -------------------------
+def _edge_arrays(csr):
+  """Return the (origin, destination, weight) arrays of a weighted CSR graph."""
+  origin, destination, weight = csr.edge_arrays()
+  if weight is None:
+    raise ValueError('graph must have numeric edge weights')
+  return origin, destination, weight
+
+_origin = _destination = _weight = _labels = None  # per-process scan state
+
+def _init_worker(origin, destination, weight, labels):
+  """Install the edge arrays (and shared labels) scanned by a process."""
+  global _origin, _destination, _weight, _labels
+  _origin, _destination, _weight, _labels = origin, destination, weight, labels
+
+def _cheapest_edges(span, comp=None):
+  """Return map from component to its cheapest (weight, id) edge in span.
+
+  span is a (start, stop) range of edge ids; comp defaults to the shared
+  component labels.
+  """
+  if comp is None:
+    comp = _labels
+  origin, destination, weight = _origin, _destination, _weight
+  best = {}
+  for e in range(*span):
+    a = comp[origin[e]]
+    b = comp[destination[e]]
+    if a != b:                                  # e leaves both components
+      key = (weight[e], e)
+      if a not in best or key < best[a]:
+        best[a] = key
+      if b not in best or key < best[b]:
+        best[b] = key
+  return best
+
+def _merge_cheapest(best, part):
+  """Merge the cheapest-edge map part into best."""
+  for c, key in part.items():
+    if c not in best or key < best[c]:
+      best[c] = key
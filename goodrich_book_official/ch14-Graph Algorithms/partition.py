@@ -1,5 +1,7 @@
 # Description: 
 
+from array import array
+
 class Partition:
   """Union-find structure for maintaining disjoint sets."""
   
@@ -48,3 +50,98 @@ class Partition:
       else:
         a._parent = b
         b._size += a._size
+
+class ArrayPartition:
+  """Union-find structure over the integer ids 0, 1, ..., n-1.
+
+  Parents and group sizes are kept in parallel arrays rather than in one
+  Position object per element.  find uses iterative path halving and union
+  merges by size, so no operation recurses.  Since an id serves as its own
+  position, make_group, find and union can stand in for those of Partition.
+  """
+
+  def __init__(self, n=0):
+    """Create a partition of the ids 0..n-1, each in a group of its own."""
+    self._parent = array('q', range(n))         # parent[i] is i for a leader
+    self._size = array('q', [1]) * n            # size[i] is valid for leaders
+    self._groups = n
+
+  def __len__(self):
+    """Return the number of elements in the partition."""
+    return len(self._parent)
+
+  def group_count(self):
+    """Return the number of groups in the partition."""
+    return self._groups
+
+  def make_group(self, e=None):
+    """Makes a new group with a new id, and returns that id.
+
+    The optional element e is accepted for compatibility with Partition,
+    but it is not stored.
+    """
+    self._parent.append(len(self._parent))
+    self._size.append(1)
+    self._groups += 1
+    return len(self._parent) - 1
+
+  def find(self, i):
+    """Finds the group containing id i and return the id of its leader."""
+    parent = self._parent
+    while parent[i] != i:
+      parent[i] = parent[parent[i]]             # path halving
+      i = parent[i]
+    return i
+
+  def group_size(self, i):
+    """Return the number of elements in the group containing id i."""
+    return self._size[self.find(i)]
+
+  def union(self, i, j):
+    """Merges the groups containing ids i and j (if distinct).
+
+    Return True if the groups were distinct, and False otherwise.
+    """
+    a = self.find(i)
+    b = self.find(j)
+    if a == b:
+      return False
+    size = self._size
+    if size[a] > size[b]:                       # a becomes the smaller group
+      a, b = b, a
+    self._parent[a] = b
+    size[b] += size[a]
+    self._groups -= 1
+    return True
+
+  def union_many(self, first, second):
+    """Merge the groups of first[k] and second[k] for every k.
+
+    The arguments are parallel sequences of ids, such as the origin and
+    destination arrays of a CSRGraph.  Return the number of merges made.
+    """
+    parent = self._parent                       # local names for speed
+    size = self._size
+    merged = 0
+    for a, b in zip(first, second):
+      while parent[a] != a:
+        parent[a] = parent[parent[a]]
+        a = parent[a]
+      while parent[b] != b:
+        parent[b] = parent[parent[b]]
+        b = parent[b]
+      if a != b:
+        if size[a] > size[b]:
+          a, b = b, a
+        parent[a] = b
+        size[b] += size[a]
+        merged += 1
+    self._groups -= merged
+    return merged
+
+  def find_many(self, ids=None):
+    """Return an array of the leaders of the given ids (all ids by default)."""
+    if ids is None:
+      ids = range(len(self._parent))
+    find = self.find
+    return array('q', (find(i) for i in ids))
@@ -0,0 +1,160 @@
+# Description: 
+
+from collections import OrderedDict
+from heapq import heappush, heappop
+from itertools import count
+from .shortest_paths import lazy_shortest_path_lengths
+
+class ShortestPathCache:
+  """LRU cache of single-source shortest-path results for a weighted Graph.
+
+  The distance map and shortest-path tree of each queried source are kept
+  for the most recently used sources, up to capacity of them.  Returned maps
+  are shared with the cache and must not be modified.
+
+  The graph should be changed through the cache.  A new edge can only
+  shorten paths, so insert_edge repairs every cached result in place;
+  removals invalidate just the results they may affect.  A change made to
+  the graph directly is noticed (through its version counter) at the next
+  query or update, and clears the whole cache.
+  """
+
+  def __init__(self, g, capacity=16):
+    """Create an empty cache for Graph g, holding results of up to capacity sources."""
+    if capacity < 1:
+      raise ValueError('capacity must be positive')
+    self._g = g
+    self._capacity = capacity
+    self._entries = OrderedDict()               # src -> (d, tree), least recent first
+    self._version = g.version()                 # graph version when entries were valid
+    self.hits = 0                               # queries answered from the cache
+    self.misses = 0                             # queries that ran Dijkstra
+
+  def graph(self):
+    """Return the graph whose shortest paths are cached."""
+    return self._g
+
+  def __len__(self):
+    """Return the number of sources with cached results."""
+    return len(self._entries)
+
+  def __contains__(self, src):
+    """Return True if results for src are cached."""
+    return src in self._entries
+
+  def clear(self):
+    """Discard all cached results (the counters are kept)."""
+    self._entries.clear()
+    self._version = self._g.version()
+
+  #------------------------- queries -------------------------
+  def shortest_path_lengths(self, src):
+    """Return dictionary mapping each vertex reachable from src to its distance."""
+    return self._lookup(src)[0]
+
+  def shortest_path_tree(self, src):
+    """Return shortest-path tree rooted at src, as for shortest_paths.shortest_path_tree."""
+    return self._lookup(src)[1]
+
+  def distance(self, src, v):
+    """Return the distance from src to v (infinite if v is unreachable)."""
+    return self._lookup(src)[0].get(v, float('inf'))
+
+  #------------------------- graph updates -------------------------
+  def insert_vertex(self, x=None):
+    """Insert and return a new Vertex of the graph; cached results stay valid."""
+    before = self._g.version()
+    v = self._g.insert_vertex(x)
+    self._check_version(before)
+    return v
+
+  def insert_edge(self, u, v, x=None):
+    """Insert and return a new Edge of the graph, repairing cached results."""
+    before = self._g.version()
+    e = self._g.insert_edge(u, v, x)
+    self._check_version(before)
+    for d, tree in self._entries.values():
+      self._repair(d, tree, e)
+    return e
+
+  def remove_edge(self, e):
+    """Remove Edge e from the graph and return its element.
+
+    Only results whose tree uses e are invalidated.
+    """
+    u, v = e.endpoints()
+    before = self._g.version()
+    x = self._g.remove_edge(e)
+    self._check_version(before)
+    for src, (d, tree) in list(self._entries.items()):
+      if tree.get(v) is e or tree.get(u) is e:
+        del self._entries[src]
+    return x
+
+  def remove_vertex(self, v):
+    """Remove Vertex v from the graph and return its element.
+
+    Only results of sources that reach v are invalidated.
+    """
+    before = self._g.version()
+    x = self._g.remove_vertex(v)
+    self._check_version(before)
+    for src, (d, tree) in list(self._entries.items()):
+      if v in d:
+        del self._entries[src]
+    return x
+
+  #------------------------- nonpublic utilities -------------------------
+  def _check_version(self, before):
+    """Record the graph's new version, clearing the cache if it also changed elsewhere.
+
+    before is the version of the graph just before the update made through
+    the cache.
+    """
+    if before != self._version:
+      self._entries.clear()                     # graph was changed behind our back
+    self._version = self._g.version()
+
+  def _lookup(self, src):
+    """Return the cached (distances, tree) pair for src, computing it if needed."""
+    if self._g.version() != self._version:
+      self.clear()
+    entry = self._entries.get(src)
+    if entry is not None:
+      self.hits += 1
+      self._entries.move_to_end(src)            # src is now most recently used
+      return entry
+    self.misses += 1
+    entry = lazy_shortest_path_lengths(self._g, src, with_tree=True)
+    self._entries[src] = entry
+    if len(self._entries) > self._capacity:
+      self._entries.popitem(last=False)         # evict least recently used
+    return entry
+
+  def _repair(self, d, tree, e):
+    """Update distances d and tree in place after the insertion of Edge e.
+
+    Only vertices whose distance decreases are revisited, in Dijkstra order.
+    """
+    u, v = e.endpoints()
+    ends = ((u, v),) if self._g.is_directed() else ((u, v), (v, u))
+    tiebreak = count()                          # vertices are not comparable
+    heap = []
+    for a, b in ends:
+      if a in d:
+        alt = d[a] + e.element()
+        if b not in d or alt < d[b]:            # e gives a better path to b
+          d[b] = alt
+          tree[b] = e
+          heappush(heap, (alt, next(tiebreak), b))
+    while heap:
+      key, _, w = heappop(heap)
+      if key > d[w]:
+        continue                                # stale entry for w
+      for f in self._g.incident_edges(w):       # outgoing edges (w,z)
+        z = f.opposite(w)
+        alt = key + f.element()
+        if z not in d or alt < d[z]:
+          d[z] = alt
+          tree[z] = f
+          heappush(heap, (alt, next(tiebreak), z))
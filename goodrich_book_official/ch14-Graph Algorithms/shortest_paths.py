@@ -1,17 +1,47 @@
 # Description: 
 
+from heapq import heappush, heappop
+from itertools import count
 from ..ch09.adaptable_heap_priority_queue import AdaptableHeapPriorityQueue
 
-def shortest_path_lengths(g, src):
+BUCKET_WEIGHT_LIMIT = 1024      # radix heap used if all weights are ints below this
+
+def shortest_path_lengths(g, src, lazy=False, target=None, bound=None,
+                          with_tree=False, weight_limit=BUCKET_WEIGHT_LIMIT):
   """Compute shortest-path distances from src to reachable vertices of g.
 
   Graph g can be undirected or directed, but must be weighted such that
   e.element() returns a numeric weight for each edge e.
 
   Return dictionary mapping each reachable vertex to its distance from src.
+
+  If lazy is True, or if target or bound is given, the lazy-deletion variant
+  is used (see lazy_shortest_path_lengths).  Otherwise the radix-heap variant
+  is tried first (see bucket_shortest_path_lengths), falling back to the
+  locator version below as soon as it relaxes an edge whose element is not
+  an int in range(weight_limit); set weight_limit to 0 to skip it.
+
+  If with_tree is True, return a (distances, tree) pair instead, where tree
+  is the shortest-path tree recorded during relaxation, in the format of
+  shortest_path_tree.
   """
+  if lazy or target is not None or bound is not None:
+    return lazy_shortest_path_lengths(g, src, target, bound, with_tree)
+  if weight_limit:
+    try:
+      result = bucket_shortest_path_lengths(g, src, with_tree=with_tree,
+                                            max_weight=weight_limit - 1)
+    except ValueError:
+      pass                                      # weights unsuited to the radix heap
+    else:
+      cloud = result[0] if with_tree else result
+      for v in g.vertices():
+        if v not in cloud:
+          cloud[v] = float('inf')               # as reported by the locator version
+      return result
   d = {}                                        # d[v] is upper bound from s to v
   cloud = {}                                    # map reachable v to its d[v] value
+  parent = {}                                   # map v to edge that set d[v]
   pq = AdaptableHeapPriorityQueue()             # vertex v will have key d[v]
   pqlocator = {}                                # map from vertex to its pq locator
 
@@ -35,15 +65,138 @@ def shortest_path_lengths(g, src):
         wgt = e.element()
         if d[u] + wgt < d[v]:                   # better path to v?
           d[v] = d[u] + wgt                     # update the distance
+          parent[v] = e                         # e is v's tentative tree edge
           pq.update(pqlocator[v], d[v], v)      # update the pq entry
 
+  if with_tree:
+    return cloud, parent                        # parents of reached vertices
   return cloud                                  # only includes reachable vertices
 
+def lazy_shortest_path_lengths(g, src, target=None, bound=None, with_tree=False):
+  """Compute shortest-path distances from src using a heap with lazy deletion.
+
+  Only vertices reached so far are pushed onto a heapq of (d, tiebreak, v)
+  tuples; an improved distance pushes a new entry and the stale one is
+  discarded when popped.  The search stops once target has been settled, or
+  once all vertices within distance bound of src have been settled.
+
+  Return dictionary mapping each settled vertex to its distance from src, or
+  a (distances, tree) pair if with_tree is True (see shortest_path_lengths).
+  """
+  d = {src: 0}                                  # d[v] is upper bound from s to v
+  cloud = {}                                    # map settled v to its d[v] value
+  parent = {}                                   # map v to edge that set d[v]
+  tree = {}                                     # parent edges of settled vertices
+  tiebreak = count()                            # vertices are not comparable
+  heap = [(0, next(tiebreak), src)]
+  while heap:
+    key, _, u = heappop(heap)
+    if u in cloud:
+      continue                                  # stale entry for settled u
+    if bound is not None and key > bound:
+      break                                     # all remaining are too far
+    cloud[u] = key                              # its correct d[u] value
+    if u is not src:
+      tree[u] = parent[u]                       # d[u] is final, and so is its edge
+    if u is target:
+      break                                     # early exit at the target
+    for e in g.incident_edges(u):               # outgoing edges (u,v)
+      v = e.opposite(u)
+      if v not in cloud:
+        # perform relaxation step on edge (u,v)
+        alt = key + e.element()
+        if v not in d or alt < d[v]:            # better path to v?
+          d[v] = alt
+          parent[v] = e
+          heappush(heap, (alt, next(tiebreak), v))
+  if with_tree:
+    return cloud, tree
+  return cloud
+
+def bucket_shortest_path_lengths(g, src, target=None, bound=None,
+                                 with_tree=False, max_weight=None):
+  """Compute shortest-path distances from src using a radix heap.
+
+  Every edge element must be a non-negative int.  The distances settled by
+  Dijkstra's algorithm never decrease, so each pending vertex v is kept in
+  bucket i, where i is the bit length of d[v] XOR last (last being the most
+  recently settled distance).  Bucket 0 holds the vertices at distance last;
+  when it is empty, the lowest nonempty bucket is redistributed around its
+  smallest distance, which moves each vertex to a lower bucket.  This takes
+  O(m + n log D) time, where D is the largest distance found, rather than
+  visiting every distance value up to D as Dial's bucket array does.
+
+  Each edge element is checked as the edge is relaxed; a ValueError is
+  raised for one that is not a non-negative int (at most max_weight, if
+  given).  target, bound and the result are as for
+  lazy_shortest_path_lengths.
+  """
+  limit = float('inf') if max_weight is None else max_weight
+  buckets = [[] for _ in range(65)]             # bucket i: d[v] ^ last has i bits
+  buckets[0].append(src)
+  d = {src: 0}                                  # d[v] is upper bound from s to v
+  cloud = {}                                    # map settled v to its d[v] value
+  parent = {}                                   # map v to edge that set d[v]
+  tree = {}                                     # parent edges of settled vertices
+  last = 0                                      # distance of bucket 0
+  pending = 1                                   # entries in all buckets
+  while pending:
+    bucket = buckets[0]
+    if not bucket:                              # redistribute lowest nonempty bucket
+      i = 1
+      while not buckets[i]:
+        i += 1
+      bucket = buckets[i]
+      buckets[i] = []
+      pending -= len(bucket)
+      live = {v: d[v] for v in bucket if v not in cloud}  # drop stale entries
+      if not live:
+        continue
+      last = min(live.values())
+      if bound is not None and last > bound:
+        break                                   # all remaining are too far
+      for v, x in live.items():
+        buckets[(x ^ last).bit_length()].append(v)
+      pending += len(live)
+      bucket = buckets[0]
+    u = bucket.pop()
+    pending -= 1
+    if u in cloud:
+      continue                                  # stale entry
+    cloud[u] = last                             # its correct d[u] value
+    if u is not src:
+      tree[u] = parent[u]
+    if u is target:
+      break                                     # early exit at the target
+    for e in g.incident_edges(u):               # outgoing edges (u,v)
+      v = e.opposite(u)
+      if v not in cloud:
+        wgt = e.element()
+        if type(wgt) is not int or not 0 <= wgt <= limit:
+          raise ValueError('edge elements must be non-negative ints')
+        alt = last + wgt
+        if v not in d or alt < d[v]:            # better path to v?
+          d[v] = alt
+          parent[v] = e
+          i = (alt ^ last).bit_length()         # zero weight joins bucket 0
+          try:
+            buckets[i].append(v)
+          except IndexError:                    # distance beyond 64 bits
+            buckets.extend([] for _ in range(i + 1 - len(buckets)))
+            buckets[i].append(v)
+          pending += 1
+  if with_tree:
+    return cloud, tree
+  return cloud
+
 def shortest_path_tree(g, s, d):
   """Reconstruct shortest-path tree rooted at vertex s, given distance map d.
 
   Return tree as a map from each reachable vertex v (other than s) to the
   edge e=(u,v) that is used to reach v from its parent u in the tree.
+
+  This rescans every incoming edge and matches floating-point sums exactly;
+  shortest_path_lengths(g, s, with_tree=True) records the tree in one pass.
   """
   tree = {}
   for v in d:
@@ -54,3 +207,103 @@ def shortest_path_tree(g, s, d):
         if d[v] == d[u] + wgt:
           tree[v] = e                            # edge e is used to reach v
   return tree
+
+def shortest_path(g, s, t, method=None, heuristic=None):
+  """Compute a shortest path from vertex s to vertex t of weighted graph g.
+
+  method is one of 'bidirectional' (the default without heuristic), 'astar'
+  (the default with heuristic) or 'dijkstra' (a one-sided search stopping
+  at t).  For A*, heuristic(v) must return a lower bound on the distance from
+  v to t that is consistent (never decreases by more than an edge's weight
+  across that edge), such as a straight-line distance.
+
+  Return a (distance, path, settled) tuple, where path is the list of edges
+  from s to t and settled is the number of vertices the search settled.  If t
+  is not reachable from s, distance is infinite and path is empty.
+  """
+  if method is None:
+    method = 'bidirectional' if heuristic is None else 'astar'
+  if method == 'bidirectional':
+    return _bidirectional_search(g, s, t)
+  if method == 'astar':
+    if heuristic is None:
+      raise ValueError('A* search requires a heuristic')
+    return _astar_search(g, s, t, heuristic)
+  if method == 'dijkstra':
+    return _astar_search(g, s, t, lambda v: 0)
+  raise ValueError('unknown method: ' + repr(method))
+
+def _tree_path(parent, v):
+  """Return list of edges from the root of a parent-edge map to vertex v."""
+  path = []
+  e = parent[v]
+  while e is not None:                          # walk up toward the root
+    path.append(e)
+    v = e.opposite(v)
+    e = parent[v]
+  path.reverse()                                # reorient path from the root
+  return path
+
+def _astar_search(g, s, t, h):
+  """A* search from s to t with consistent heuristic h; see shortest_path."""
+  d = {s: 0}                                    # d[v] is upper bound from s to v
+  parent = {s: None}                            # edge used to reach v
+  settled = set()
+  tiebreak = count()
+  heap = [(h(s), next(tiebreak), 0, s)]         # (d[v]+h(v), tiebreak, d[v], v)
+  while heap:
+    _, _, key, u = heappop(heap)
+    if u in settled:
+      continue                                  # stale entry
+    settled.add(u)
+    if u is t:
+      return key, _tree_path(parent, t), len(settled)
+    for e in g.incident_edges(u):
+      v = e.opposite(u)
+      if v not in settled:
+        alt = key + e.element()
+        if v not in d or alt < d[v]:
+          d[v] = alt
+          parent[v] = e
+          heappush(heap, (alt + h(v), next(tiebreak), alt, v))
+  return float('inf'), [], len(settled)
+
+def _bidirectional_search(g, s, t):
+  """Bidirectional Dijkstra from s to t; see shortest_path."""
+  if s is t:
+    return 0, [], 1
+  # index 0 holds the forward search from s, index 1 the backward one from t
+  d = ({s: 0}, {t: 0})
+  parent = ({s: None}, {t: None})
+  settled = (set(), set())
+  tiebreak = count()
+  heaps = ([(0, next(tiebreak), s)], [(0, next(tiebreak), t)])
+  best = float('inf')                           # length of best path found
+  meet = None                                   # vertex where it joins
+  while heaps[0] and heaps[1]:
+    if heaps[0][0][0] + heaps[1][0][0] >= best:
+      break                                     # no shorter path remains
+    side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+    key, _, u = heappop(heaps[side])
+    if u in settled[side]:
+      continue                                  # stale entry
+    settled[side].add(u)
+    dist, other = d[side], d[1-side]
+    for e in g.incident_edges(u, side == 0):    # backward search uses INCOMING
+      v = e.opposite(u)
+      if v not in settled[side]:
+        alt = key + e.element()
+        if v not in dist or alt < dist[v]:
+          dist[v] = alt
+          parent[side][v] = e
+          heappush(heaps[side], (alt, next(tiebreak), v))
+        if v in other and dist[v] + other[v] < best:
+          best = dist[v] + other[v]
+          meet = v
+  count_settled = len(settled[0]) + len(settled[1])
+  if meet is None:
+    return float('inf'), [], count_settled
+  path = _tree_path(parent[0], meet)            # s to meet
+  back = _tree_path(parent[1], meet)            # t to meet, along reversed edges
+  back.reverse()
+  return best, path + back, count_settled
@@ -0,0 +1,49 @@
+# Description: 
+
+import sys
+from time import perf_counter
+
+from .graph_generators import erdos_renyi_graph
+from .shortest_paths import shortest_path_lengths, lazy_shortest_path_lengths
+from .shortest_paths import bucket_shortest_path_lengths
+
+def time_call(f, *args, **kwargs):
+  """Return (result, seconds) for one call of f."""
+  start = perf_counter()
+  result = f(*args, **kwargs)
+  return result, perf_counter() - start
+
+def compare(label, g, sources):
+  """Print the time of the locator-based, lazy and radix-heap Dijkstra on g."""
+  eager = lazy = bucket = 0.0
+  for s in sources:
+    d1, t1 = time_call(shortest_path_lengths, g, s, weight_limit=0)
+    d2, t2 = time_call(lazy_shortest_path_lengths, g, s)
+    d3, t3 = time_call(bucket_shortest_path_lengths, g, s)
+    finite = {v: x for v, x in d1.items() if x != float('inf')}
+    assert finite == d2 == d3, 'distance maps differ'
+    eager += t1
+    lazy += t2
+    bucket += t3
+  print('{0:<8} n={1:<7} m={2:<9} locator {3:8.3f}s   lazy {4:8.3f}s   radix {5:8.3f}s'
+        .format(label, g.vertex_count(), g.edge_count(), eager, lazy, bucket))
+
+if __name__ == '__main__':
+  try:
+    n = int(sys.argv[1])
+  except (IndexError, ValueError):
+    n = 20000
+  sources = range(3)
+  for label, size, m in (('sparse', n, 4 * n), ('dense', n // 20, (n // 20) ** 2 // 4)):
+    g = erdos_renyi_graph(size, m, seed=size)
+    verts = list(g.vertices())
+    compare(label, g, [verts[k] for k in sources])
+  # early exit: distance bound and single target on the sparse graph
+  g = erdos_renyi_graph(n, 4 * n, seed=1)
+  verts = list(g.vertices())
+  full, t_full = time_call(lazy_shortest_path_lengths, g, verts[0])
+  far = max(full.values())
+  _, t_bound = time_call(lazy_shortest_path_lengths, g, verts[0], bound=far // 4)
+  _, t_target = time_call(lazy_shortest_path_lengths, g, verts[0], target=verts[1])
+  print('early exit: full {0:.3f}s   bound {1:.3f}s   target {2:.3f}s'
+        .format(t_full, t_bound, t_target))
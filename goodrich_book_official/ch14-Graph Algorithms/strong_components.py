@@ -0,0 +1,147 @@
+# Description: 
+
+from .graph import Graph
+
+def strongly_connected_components(g, method='tarjan'):
+  """Return a list of the strongly connected components of Graph g.
+
+  Each component is a list of vertices.  Components are listed in reverse
+  topological order: every edge between two components leads from a later
+  component to an earlier one.  method is 'tarjan' (one DFS) or 'kosaraju'
+  (two DFS passes, the second over incoming edges).  Both use explicit
+  stacks and run in O(n+m) time.
+
+  For an undirected graph, the components are its connected components.
+  """
+  verts = list(g.vertices())
+  if method == 'tarjan':
+    index = {v: i for i, v in enumerate(verts)}
+    adj = [[index[e.opposite(v)] for e in g.incident_edges(v)] for v in verts]
+    group, count = _tarjan(adj)
+    components = [[] for _ in range(count)]
+    for i, c in enumerate(group):
+      components[c].append(verts[i])
+    return components
+  if method == 'kosaraju':
+    return _kosaraju(g, verts)
+  raise ValueError('unknown method: ' + repr(method))
+
+def condensation(g, components=None):
+  """Return the condensation DAG of Graph g as a (dag, component_of) pair.
+
+  dag is a new directed Graph with one vertex per strongly connected
+  component (whose element is the list of member vertices of g) and one edge
+  (with element None) for each pair of components joined by an edge of g.
+  component_of maps each vertex of g to its vertex of dag.  The components
+  may be given, as returned by strongly_connected_components.
+  """
+  if components is None:
+    components = strongly_connected_components(g)
+  dag = Graph(directed=True)
+  component_of = {}
+  for members in components:
+    c = dag.insert_vertex(members)
+    for v in members:
+      component_of[v] = c
+  batch = []
+  for members in components:
+    c = component_of[members[0]]
+    joined = set()                              # components already linked from c
+    for u in members:
+      for e in g.incident_edges(u):
+        d = component_of[e.opposite(u)]
+        if d is not c and d not in joined:
+          joined.add(d)
+          batch.append((c, d))
+  dag.insert_edges(batch, trusted=True)
+  return dag, component_of
+
+#------------------------- nonpublic utilities -------------------------
+def _kosaraju(g, verts):
+  """Return components of g in reverse topological order, by Kosaraju."""
+  finished = []                                 # vertices in order of finishing
+  visited = set()
+  for root in verts:
+    if root in visited:
+      continue
+    visited.add(root)
+    stack = [(root, g.incident_edges(root))]
+    while stack:
+      v, edges = stack[-1]
+      for e in edges:
+        w = e.opposite(v)
+        if w not in visited:
+          visited.add(w)
+          stack.append((w, g.incident_edges(w)))
+          break
+      else:
+        stack.pop()
+        finished.append(v)                      # v is finished
+  # sweeping incoming edges in reverse finishing order yields each component
+  # in topological order, so the list is reversed at the end
+  components = []
+  assigned = set()
+  for root in reversed(finished):
+    if root in assigned:
+      continue
+    assigned.add(root)
+    members = [root]
+    frontier = [root]
+    while frontier:
+      v = frontier.pop()
+      for e in g.incident_edges(v, False):      # consider INCOMING edges
+        w = e.opposite(v)
+        if w not in assigned:
+          assigned.add(w)
+          members.append(w)
+          frontier.append(w)
+    components.append(members)
+  components.reverse()
+  return components
+
+def _tarjan(adj):
+  """Return (group, count) for the strongly connected components of adj.
+
+  adj[v] lists the vertex ids adjacent from vertex id v.  group[v] is the
+  component of v; components are numbered in reverse topological order, so
+  that every edge between components leads to a lower number.  This is
+  Tarjan's algorithm with an explicit stack instead of recursion.
+  """
+  n = len(adj)
+  order = [-1] * n                              # discovery number of each vertex
+  low = [0] * n                                 # lowest discovery number reached
+  group = [-1] * n
+  stack = []                                    # vertices of unfinished components
+  counter = count = 0
+  for root in range(n):
+    if order[root] >= 0:
+      continue
+    order[root] = low[root] = counter
+    counter += 1
+    stack.append(root)
+    work = [(root, 0)]                          # (vertex, next neighbor index)
+    while work:
+      v, i = work[-1]
+      if i < len(adj[v]):
+        work[-1] = (v, i + 1)
+        w = adj[v][i]
+        if order[w] < 0:                        # tree edge: "recur" on w
+          order[w] = low[w] = counter
+          counter += 1
+          stack.append(w)
+          work.append((w, 0))
+        elif group[w] < 0:                      # w is still on the stack
+          low[v] = min(low[v], order[w])
+      else:
+        work.pop()
+        if work:
+          u = work[-1][0]
+          low[u] = min(low[u], low[v])
+        if low[v] == order[v]:                  # v is the root of a component
+          while True:
+            w = stack.pop()
+            group[w] = count
+            if w == v:
+              break
+          count += 1
+  return group, count
@@ -1,9 +1,15 @@
 # Description: 
 
 from copy import deepcopy
+from .graph import Graph
+from .strong_components import _tarjan
 
 def floyd_warshall(g):
-  """Return a new graph that is the transitive closure of g."""
+  """Return a new graph that is the transitive closure of g.
+
+  This copies g and makes O(n^3) get_edge calls; transitive_closure(g) builds
+  the same graph from a ReachabilityIndex instead.
+  """
   closure = deepcopy(g)                      # imported from copy module
   verts = list(closure.vertices())           # make indexable list
   n = len(verts)
@@ -19,6 +25,126 @@ def floyd_warshall(g):
               closure.insert_edge(verts[i],verts[j])
   return closure
 
+class ReachabilityIndex:
+  """Reachability information for a graph, with one bit row per vertex group.
+
+  Each row is a Python int whose bit j is set when group j is reachable, so
+  a whole row is merged with a single OR.  By default, the groups are the
+  strongly connected components of the graph, whose condensation is a DAG
+  that is processed in a single reverse topological pass.  With condense set
+  to False, each vertex is its own group and the rows are closed by a bitset
+  version of the Floyd-Warshall algorithm.
+
+  The index is a snapshot; it does not follow later changes to the graph.
+  """
+
+  def __init__(self, g, condense=True):
+    """Compute the reachability index of graph g."""
+    self._graph = g
+    self._directed = g.is_directed()
+    self._verts = list(g.vertices())
+    self._index = {v: i for i, v in enumerate(self._verts)}
+    index = self._index
+    self._adj = [[index[e.opposite(v)] for e in g.incident_edges(v)]
+                 for v in self._verts]
+    if condense:
+      self._group, count = _tarjan(self._adj)
+      self._rows = self._condensed_rows(count)
+    else:
+      self._group = list(range(len(self._verts)))
+      self._rows = self._floyd_warshall_rows()
+    self._members = [[] for _ in self._rows]    # vertices of each group
+    for v, c in enumerate(self._group):
+      self._members[c].append(v)
+
+  def _condensed_rows(self, count):
+    """Return the rows of the components, numbered in reverse topological order."""
+    group = self._group
+    members = [[] for _ in range(count)]
+    for v, c in enumerate(group):
+      members[c].append(v)
+    rows = []
+    for c in range(count):                      # successors are numbered lower
+      row = 1 << c                              # a group reaches itself
+      for v in members[c]:
+        for w in self._adj[v]:
+          if group[w] != c:
+            row |= rows[group[w]]               # merge a whole row at once
+      rows.append(row)
+    return rows
+
+  def _floyd_warshall_rows(self):
+    """Return the closed rows of the vertices, computed Floyd-Warshall style."""
+    rows = []
+    for v, nbrs in enumerate(self._adj):
+      row = 1 << v
+      for w in nbrs:
+        row |= 1 << w
+      rows.append(row)
+    n = len(rows)
+    for k in range(n):
+      bit = 1 << k
+      row_k = rows[k]
+      for i in range(n):
+        if rows[i] & bit:                       # i reaches k, so i reaches all k does
+          rows[i] |= row_k
+    return rows
+
+  def _groups_of(self, row):
+    """Generate the group numbers whose bits are set in row."""
+    while row:
+      low = row & -row                          # isolate lowest set bit
+      yield low.bit_length() - 1
+      row ^= low
+
+  #------------------------- public methods -------------------------
+  def reachable(self, u, v):
+    """Return True if there is a path from vertex u to vertex v (u reaches u)."""
+    gu = self._group[self._index[u]]
+    gv = self._group[self._index[v]]
+    return (self._rows[gu] >> gv) & 1 == 1
+
+  def descendants(self, u):
+    """Generate all vertices other than u that are reachable from vertex u."""
+    i = self._index[u]
+    for c in self._groups_of(self._rows[self._group[i]]):
+      for v in self._members[c]:
+        if v != i:
+          yield self._verts[v]
+
+  def reach_count(self, u):
+    """Return the number of vertices other than u reachable from vertex u."""
+    return sum(1 for _ in self.descendants(u))
+
+  def to_graph(self):
+    """Return a new graph that is the transitive closure of the indexed graph.
+
+    The result has a new vertex (with the same element) for each vertex, a
+    copy of each original edge, and an edge with element None for every other
+    reachable pair, as for floyd_warshall.  Original edge elements are read
+    from the graph as it is now.
+    """
+    closure = Graph(self._directed)
+    new = [closure.insert_vertex(v.element()) for v in self._verts]
+    batch = []
+    for i, v in enumerate(self._verts):
+      for e in self._graph.incident_edges(v):
+        j = self._index[e.opposite(v)]
+        if self._directed or i <= j:        # an undirected self-loop is listed once
+          batch.append((new[i], new[j], e.element()))
+    for i, v in enumerate(self._verts):
+      adjacent = set(self._adj[i])
+      for w in self.descendants(v):
+        j = self._index[w]
+        if j not in adjacent and (self._directed or i < j):
+          batch.append((new[i], new[j], None))
+    closure.insert_edges(batch, trusted=True)
+    return closure
+
+def transitive_closure(g):
+  """Return a new graph that is the transitive closure of g (bitset version)."""
+  return ReachabilityIndex(g).to_graph()
+
 if __name__ == '__main__':
   from graph_examples import figure_14_11 as example
   g = example()